@@ -12,6 +12,7 @@ from loguru import logger
 from config.settings import config
 from app_controller import ApplicationController
 from ui.main_window import MainWindow
+from ui.styles import APP_STYLESHEET
 
 
 def setup_logging():
@@ -23,7 +24,7 @@ def setup_logging():
     logger.add(
         sys.stderr,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
-        level=config.logging_level
+        level=config.logging_console_level
     )
     
     # Add file logger
@@ -65,6 +66,7 @@ def main():
         app = QApplication(sys.argv)
         app.setApplicationName("AI Text Assistant")
         app.setOrganizationName("AITextAssistant")
+        app.setStyleSheet(APP_STYLESHEET)
         
         # Create and show main window
         logger.info("Creating main window...")
@@ -3,18 +3,22 @@ Application Controller
 Central orchestrator for all application components.
 """
 
+import os
 import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Dict, Iterator, List, Tuple
 
+import numpy as np
 from loguru import logger
 
 from config.settings import config
-from ingestion.pdf_reader import PDFReader
-from ingestion.docx_reader import DOCXReader
 from ingestion.chunker import TextChunker
+from ingestion.pipeline import extract_and_chunk
 from embeddings.embedder import Embedder
 from embeddings.vector_store import VectorStore
+from embeddings.embedding_cache import EmbeddingCache
 from retrieval.local_search import LocalSearch
 from retrieval.online_search import OnlineSearch
 from retrieval.ranker import Ranker
@@ -28,13 +32,14 @@ class ApplicationController:
     Manages all components and coordinates their interactions.
     """
     
+    # Save the index every N documents while indexing
+    CHECKPOINT_INTERVAL = 50
+    
     def __init__(self):
         """Initialize the application controller."""
         logger.info("Initializing Application Controller")
         
         # Document processing components
-        self.pdf_reader = PDFReader()
-        self.docx_reader = DOCXReader()
         self.chunker = TextChunker(
             chunk_size=config.chunk_size,
             overlap=config.chunk_overlap
@@ -42,6 +47,7 @@ class ApplicationController:
         
         # Embedding and search components
         self.embedder: Optional[Embedder] = None
+        self.embedding_cache: Optional[EmbeddingCache] = None
         self.vector_store: Optional[VectorStore] = None
         self.local_search: Optional[LocalSearch] = None
         self.online_search: Optional[OnlineSearch] = None
@@ -70,10 +76,13 @@ class ApplicationController:
             logger.info("Loading embedding model...")
             self.embedder = Embedder()
             self.embedder.load_model()
+            if config.performance_cache_embeddings:
+                self.embedding_cache = EmbeddingCache()
             
             # Initialize vector store
             logger.info("Initializing vector store...")
-            self.vector_store = VectorStore()
+            # Embedder output is already L2-normalized
+            self.vector_store = VectorStore(assume_normalized=True)
             
             # Try to load existing index
             if not self.vector_store.load():
@@ -137,11 +146,13 @@ class ApplicationController:
             if progress_callback:
                 progress_callback(10, "Scanning for documents...")
             
-            # Find all supported documents
-            documents = []
-            for fmt in config.supported_formats:
-                found = list(folder.glob(f"*.{fmt}"))
-                documents.extend(found)
+            # Find all supported documents in a single directory pass
+            allowed = {f".{fmt.lower()}" for fmt in config.supported_formats}
+            with os.scandir(folder) as entries:
+                documents = sorted(
+                    Path(entry.path) for entry in entries
+                    if entry.is_file() and os.path.splitext(entry.name)[1].lower() in allowed
+                )
             
             logger.info(f"Found {len(documents)} documents to process")
             
@@ -152,87 +163,241 @@ class ApplicationController:
             if progress_callback:
                 progress_callback(20, f"Processing {len(documents)} documents...")
             
-            # Process each document
-            all_chunks = []
-            processed_count = 0
-            
-            for doc_path in documents:
-                try:
-                    logger.info(f"Processing: {doc_path.name}")
-                    
-                    # Extract text based on file type
-                    if doc_path.suffix.lower() == '.pdf':
-                        text = self.pdf_reader.extract_text(doc_path)
-                    elif doc_path.suffix.lower() in ['.docx', '.doc']:
-                        text = self.docx_reader.extract_text(doc_path)
-                    elif doc_path.suffix.lower() == '.txt':
-                        text = doc_path.read_text(encoding='utf-8')
-                    else:
-                        logger.warning(f"Unsupported format: {doc_path.suffix}")
-                        continue
-                    
-                    if not text:
-                        logger.warning(f"No text extracted from {doc_path.name}")
-                        continue
-                    
-                    # Chunk the text
-                    metadata = {
-                        'file_name': doc_path.name,
-                        'file_path': str(doc_path),
-                        'file_type': doc_path.suffix[1:]
-                    }
-                    
-                    chunks = self.chunker.chunk_text(text, metadata)
-                    all_chunks.extend(chunks)
-                    
-                    processed_count += 1
-                    progress = 20 + int((processed_count / len(documents)) * 50)
-                    
-                    if progress_callback:
-                        progress_callback(
-                            progress,
-                            f"Processed {processed_count}/{len(documents)} documents..."
-                        )
-                    
-                except Exception as e:
-                    logger.error(f"Error processing {doc_path.name}: {e}")
-                    continue
+            # Build a fresh store next to the live one: searches keep using the
+            # current index, and checkpoints never overwrite it mid-run
+            live_path = self.vector_store.index_path
+            store = VectorStore(
+                index_path=str(live_path) + ".building",
+                dimension=self.vector_store.dimension,
+                assume_normalized=True
+            )
+            store.create_index()
+            
+            try:
+                total_chunks, processed_count = self._build_store(store, documents, progress_callback)
+                
+                if not total_chunks:
+                    logger.error("No chunks created from documents")
+                    store.delete_files()
+                    return False
+                
+                if progress_callback:
+                    progress_callback(95, "Saving search index...")
+                
+                # Save index, then replace the live files and store in one step
+                store.save()
+                store.move_files(str(live_path))
+                
+            except Exception:
+                store.delete_files()
+                raise
+            
+            self.vector_store = store
+            self.local_search.vector_store = store
+            self.local_search.clear_query_cache()
+            
+            logger.info(f"Created {total_chunks} chunks from {processed_count} documents")
             
-            if not all_chunks:
-                logger.error("No chunks created from documents")
-                return False
+            if progress_callback:
+                progress_callback(100, "Indexing complete!")
             
-            logger.info(f"Created {len(all_chunks)} chunks from {processed_count} documents")
+            logger.info("✓ Document indexing completed successfully")
+            return True
             
-            if progress_callback:
-                progress_callback(70, "Generating embeddings...")
+        except Exception as e:
+            logger.error(f"Error indexing documents: {e}")
+            return False
+    
+    def _build_store(
+        self,
+        store: VectorStore,
+        documents: List[Path],
+        progress_callback: Optional[Callable[[int, str], None]] = None
+    ) -> Tuple[int, int]:
+        """
+        Chunk, embed and add documents to a store, checkpointing it as it grows.
+        
+        Args:
+            store: Vector store being built
+            documents: Document paths to index
+            progress_callback: Optional callback for progress updates (progress%, message)
             
-            # Generate embeddings
-            chunk_texts = [chunk['text'] for chunk in all_chunks]
-            embeddings = self.embedder.encode(chunk_texts)
+        Returns:
+            Tuple of (chunks indexed, documents processed)
+        """
+        processed_count = 0
+        total_chunks = 0
+        pending_chunks: List[dict] = []
+        chunk_ids: Dict[str, int] = {}
+        
+        # Workers keep extracting the next documents while this loop encodes;
+        # chunks from small files are pooled so the encoder gets full batches
+        for doc_path, chunks in self._iter_chunks(documents):
+            pending_chunks.extend(chunks)
+            processed_count += 1
+            del chunks
             
-            logger.info(f"Generated {len(embeddings)} embeddings")
+            checkpoint = processed_count % self.CHECKPOINT_INTERVAL == 0
             
-            if progress_callback:
-                progress_callback(85, "Building search index...")
+            if len(pending_chunks) >= self.embedder.batch_size or checkpoint:
+                total_chunks += self._index_chunks(store, pending_chunks, chunk_ids)
+                pending_chunks = []
             
-            # Clear existing index and add new documents
-            self.vector_store.clear()
-            self.vector_store.create_index()
-            self.vector_store.add_documents(embeddings, all_chunks)
+            if checkpoint:
+                logger.info(f"Checkpointing index after {processed_count} documents")
+                store.save()
             
-            # Save index
-            self.vector_store.save()
+            progress = 20 + int((processed_count / len(documents)) * 70)
             
             if progress_callback:
-                progress_callback(100, "Indexing complete!")
+                progress_callback(
+                    progress,
+                    f"Indexed {processed_count}/{len(documents)} documents..."
+                )
+        
+        # Flush the tail batch
+        if pending_chunks:
+            total_chunks += self._index_chunks(store, pending_chunks, chunk_ids)
+        
+        return total_chunks, processed_count
+    
+    def _iter_chunks(self, documents: List[Path]) -> Iterator[Tuple[Path, List[dict]]]:
+        """
+        Extract and chunk documents in parallel worker processes.
+        
+        At most two documents per worker are in flight, so finished chunks
+        do not pile up in memory while the caller is embedding.
+        
+        Args:
+            documents: Paths of documents to process
             
-            logger.info("✓ Document indexing completed successfully")
-            return True
+        Yields:
+            Tuple of (document path, chunks) for each document as it completes
+        """
+        workers = min(os.cpu_count() or 1, len(documents))
+        remaining = iter(documents)
+        
+        # Spawned, not forked: this runs on a QThread with torch and FAISS thread pools live
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as executor:
+            pending = {}
+            
+            def submit_next() -> None:
+                doc_path = next(remaining, None)
+                if doc_path is not None:
+                    logger.debug(f"Processing: {doc_path.name}")
+                    future = executor.submit(
+                        extract_and_chunk,
+                        str(doc_path),
+                        self.chunker.chunk_size,
+                        self.chunker.overlap
+                    )
+                    pending[future] = doc_path
+            
+            for _ in range(workers * 2):
+                submit_next()
+            
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    doc_path = pending.pop(future)
+                    submit_next()
+                    
+                    try:
+                        chunks = future.result()
+                    except Exception as e:
+                        logger.error(f"Error processing {doc_path.name}: {e}")
+                        continue
+                    
+                    if chunks:
+                        yield doc_path, chunks
+    
+    def _index_chunks(self, store: VectorStore, chunks: List[dict], chunk_ids: Dict[str, int]) -> int:
+        """
+        Embed a batch of chunks and add them to a vector store.
+        
+        Chunks whose text was already indexed in this run (repeated headers,
+        footers, boilerplate) are not embedded again; their metadata is
+        attached to the first copy as an extra source.
+        
+        Args:
+            store: Vector store being built
+            chunks: Chunk dictionaries with a 'text' key
+            chunk_ids: Content hash to document ID map for this indexing run
             
-        except Exception as e:
-            logger.error(f"Error indexing documents: {e}")
-            return False
+        Returns:
+            Number of chunks indexed, including duplicates
+        """
+        next_id = len(store.documents)
+        unique_chunks: List[dict] = []
+        unique_hashes: List[str] = []
+        aliases: List[Tuple[int, dict]] = []
+        
+        for chunk in chunks:
+            key = EmbeddingCache.hash_text(chunk['text'])
+            if key in chunk_ids:
+                source = {k: v for k, v in chunk.items() if k not in ('text', 'char_count')}
+                aliases.append((chunk_ids[key], source))
+            else:
+                chunk_ids[key] = next_id + len(unique_chunks)
+                unique_chunks.append(chunk)
+                unique_hashes.append(key)
+        
+        if unique_chunks:
+            embeddings = self._embed_chunks(unique_chunks, unique_hashes)
+            store.add_documents(embeddings, unique_chunks)
+        
+        for doc_id, source in aliases:
+            store.add_sources(doc_id, [source])
+        
+        if aliases:
+            logger.debug(f"Skipped {len(aliases)} duplicate chunks")
+        
+        return len(chunks)
+    
+    def _embed_chunks(self, chunks: List[dict], hashes: Optional[List[str]] = None) -> np.ndarray:
+        """
+        Embed chunks, only running the encoder on chunks missing from the cache
+        (every chunk when embedding caching is disabled).
+        
+        Args:
+            chunks: Chunk dictionaries with a 'text' key
+            hashes: Precomputed content hashes of the chunks
+            
+        Returns:
+            numpy array of embeddings in chunk order
+        """
+        if self.embedding_cache is None:
+            return self.embedder.encode([chunk['text'] for chunk in chunks])
+        
+        model = self.embedder.cache_key
+        if hashes is None:
+            hashes = [EmbeddingCache.hash_text(chunk['text']) for chunk in chunks]
+        cached = self.embedding_cache.get_many(hashes, model)
+        uncached_idx = [i for i, key in enumerate(hashes) if key not in cached]
+        logger.debug(f"Embedding cache: {len(chunks) - len(uncached_idx)} hits, {len(uncached_idx)} misses")
+        
+        if len(uncached_idx) == len(chunks):
+            # Nothing cached: hand the encoder output over without copying it
+            fresh = self.embedder.encode([chunk['text'] for chunk in chunks])
+            self.embedding_cache.put_many(list(zip(hashes, fresh)), model)
+            return fresh
+        
+        embeddings = np.empty((len(chunks), self.embedder.embedding_dimension), dtype=np.float32)
+        
+        if uncached_idx:
+            fresh = self.embedder.encode([chunks[i]['text'] for i in uncached_idx])
+            embeddings[uncached_idx] = fresh
+            self.embedding_cache.put_many(
+                [(hashes[i], vec) for i, vec in zip(uncached_idx, fresh)], model
+            )
+        
+        for i, key in enumerate(hashes):
+            if key in cached:
+                embeddings[i] = cached[key]
+        
+        return embeddings
     
     def get_autocomplete(self) -> Optional[Autocomplete]:
         """Get autocomplete instance."""
@@ -9,6 +9,12 @@ from typing import List
 import yaml
 from loguru import logger
 
+# libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class Settings:
     """Application configuration manager."""
@@ -38,8 +44,9 @@ class Settings:
                 return
             
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f)
+                self._config = yaml.load(f, Loader=SafeLoader)
             
+            self._bind_attrs()
             logger.info(f"Configuration loaded from {self.config_path}")
         except Exception as e:
             logger.error(f"Error loading config: {e}")
@@ -56,13 +63,17 @@ class Settings:
             },
             'embedding': {
                 'model_name': 'sentence-transformers/all-MiniLM-L6-v2',
-                'device': 'cpu',
-                'batch_size': 32
+                'device': 'auto',
+                'batch_size': 32,
+                'quantize': True,
+                'backend': 'torch',
+                'cache_path': './models/embedding_cache.db'
             },
             'vector_store': {
                 'index_path': './models/faiss_index',
                 'dimension': 384,
-                'metric': 'cosine'
+                'metric': 'cosine',
+                'tiered_threshold': 50000
             },
             'retrieval': {
                 'top_k_results': 5,
@@ -74,124 +85,105 @@ class Settings:
                 'trigger_threshold': 3,
                 'debounce_ms': 500
             },
+            'llm': {
+                'model_path': './models/Phi-3-mini-4k-instruct-q4.gguf',
+                'temperature': 0.7,
+                'max_tokens': 100,
+                'top_p': 0.9,
+                'top_k': 40
+            },
             'online_search': {
                 'enabled': True,
                 'cache_enabled': True,
-                'cache_path': './models/online_cache.pkl',
+                'cache_path': './models/online_cache.db',
                 'max_results': 3
             },
             'logging': {
                 'level': 'INFO',
+                'console_level': 'WARNING',
                 'file_path': './logs/app.log'
+            },
+            'performance': {
+                'use_gpu': False,
+                'num_threads': 4,
+                'cache_embeddings': True,
+                'cache_size_mb': 512
             }
         }
+        self._bind_attrs()
     
-    # Document settings
-    @property
-    def documents_folder(self) -> Path:
-        """Get documents folder path."""
-        return Path(self._config['documents']['folder_path'])
-    
-    @property
-    def supported_formats(self) -> List[str]:
-        """Get list of supported document formats."""
-        return self._config['documents']['supported_formats']
-    
-    @property
-    def chunk_size(self) -> int:
-        """Get text chunk size for processing."""
-        return self._config['documents']['chunk_size']
-    
-    @property
-    def chunk_overlap(self) -> int:
-        """Get chunk overlap size."""
-        return self._config['documents']['chunk_overlap']
-    
-    # Embedding settings
-    @property
-    def embedding_model(self) -> str:
-        """Get embedding model name."""
-        return self._config['embedding']['model_name']
-    
-    @property
-    def embedding_device(self) -> str:
-        """Get device for embedding model."""
-        return self._config['embedding']['device']
-    
-    @property
-    def embedding_batch_size(self) -> int:
-        """Get batch size for embedding generation."""
-        return self._config['embedding']['batch_size']
-    
-    # Vector store settings
-    @property
-    def vector_store_path(self) -> Path:
-        """Get vector store index path."""
-        return Path(self._config['vector_store']['index_path'])
-    
-    @property
-    def vector_dimension(self) -> int:
-        """Get embedding dimension."""
-        return self._config['vector_store']['dimension']
-    
-    # Retrieval settings
-    @property
-    def top_k_results(self) -> int:
-        """Get number of top results to retrieve."""
-        return self._config['retrieval']['top_k_results']
-    
-    @property
-    def similarity_threshold(self) -> float:
-        """Get minimum similarity threshold."""
-        return self._config['retrieval']['similarity_threshold']
-    
-    @property
-    def max_context_length(self) -> int:
-        """Get maximum context length."""
-        return self._config['retrieval']['max_context_length']
-    
-    # Suggestion settings
-    @property
-    def context_window_size(self) -> int:
-        """Get context window size for suggestions."""
-        return self._config['suggestion']['context_window_size']
-    
-    @property
-    def trigger_threshold(self) -> int:
-        """Get trigger threshold for suggestions."""
-        return self._config['suggestion']['trigger_threshold']
-    
-    @property
-    def debounce_ms(self) -> int:
-        """Get debounce time in milliseconds."""
-        return self._config['suggestion']['debounce_ms']
-    
-    # Online search settings
-    @property
-    def online_search_enabled(self) -> bool:
-        """Check if online search is enabled."""
-        return self._config['online_search']['enabled']
-    
-    @property
-    def online_cache_path(self) -> Path:
-        """Get online search cache path."""
-        return Path(self._config['online_search']['cache_path'])
-    
-    @property
-    def online_max_results(self) -> int:
-        """Get maximum online search results."""
-        return self._config['online_search']['max_results']
-    
-    # Logging settings
-    @property
-    def logging_level(self) -> str:
-        """Get logging level."""
-        return self._config['logging']['level']
-    
-    @property
-    def logging_file_path(self) -> Path:
-        """Get log file path."""
-        return Path(self._config['logging']['file_path'])
+    def _bind_attrs(self) -> None:
+        """
+        Bind configuration values to plain attributes.
+        
+        Settings are read in hot paths (chunking, suggestions), so they are
+        resolved once here instead of walking the nested dict on every access.
+        """
+        documents = self._config['documents']
+        embedding = self._config['embedding']
+        vector_store = self._config['vector_store']
+        retrieval = self._config['retrieval']
+        suggestion = self._config['suggestion']
+        online_search = self._config['online_search']
+        logging = self._config['logging']
+        performance = self._config.get('performance', {})
+        llm = self._config.get('llm', {})
+        
+        # Document settings
+        self.documents_folder: Path = Path(documents['folder_path'])
+        self.supported_formats: List[str] = documents['supported_formats']
+        self.chunk_size: int = documents['chunk_size']
+        self.chunk_overlap: int = documents['chunk_overlap']
+        
+        # Embedding settings
+        self.embedding_model: str = embedding['model_name']
+        self.embedding_device: str = embedding['device']
+        self.embedding_batch_size: int = embedding['batch_size']
+        # INT8-quantize the embedding model on CPU, run it in FP16 on CUDA
+        self.embedding_quantize: bool = embedding.get('quantize', True)
+        # 'torch' (SentenceTransformer) or 'onnx' (INT8 ONNX Runtime)
+        self.embedding_backend: str = embedding.get('backend', 'torch')
+        self.embedding_cache_path: Path = Path(embedding.get('cache_path', './models/embedding_cache.db'))
+        
+        # Vector store settings
+        self.vector_store_path: Path = Path(vector_store['index_path'])
+        self.vector_dimension: int = vector_store['dimension']
+        # Corpus size above which the hot/cold tiered index is used
+        self.vector_tiered_threshold: int = vector_store.get('tiered_threshold', 50000)
+        
+        # Retrieval settings
+        self.top_k_results: int = retrieval['top_k_results']
+        self.similarity_threshold: float = retrieval['similarity_threshold']
+        self.max_context_length: int = retrieval['max_context_length']
+        
+        # Suggestion settings
+        self.context_window_size: int = suggestion['context_window_size']
+        self.trigger_threshold: int = suggestion['trigger_threshold']
+        self.debounce_ms: int = suggestion['debounce_ms']
+        
+        # Local LLM settings (llama.cpp GGUF model)
+        self.llm_model_path: Path = Path(llm.get('model_path', './models/Phi-3-mini-4k-instruct-q4.gguf'))
+        self.llm_temperature: float = llm.get('temperature', 0.7)
+        self.llm_max_tokens: int = llm.get('max_tokens', 100)
+        self.llm_top_p: float = llm.get('top_p', 0.9)
+        self.llm_top_k: int = llm.get('top_k', 40)
+        
+        # Online search settings
+        self.online_search_enabled: bool = online_search['enabled']
+        self.online_cache_path: Path = Path(online_search['cache_path'])
+        self.online_max_results: int = online_search['max_results']
+        
+        # Logging settings
+        self.logging_level: str = logging['level']
+        # Console output is kept quieter than the log file
+        self.logging_console_level: str = logging.get('console_level', 'WARNING')
+        self.logging_file_path: Path = Path(logging['file_path'])
+        
+        # Performance settings
+        # FAISS OpenMP threads; 0 or less picks half the logical CPUs
+        self.performance_num_threads: int = performance.get('num_threads') or 0
+        # Reuse cached chunk embeddings when re-indexing
+        self.performance_cache_embeddings: bool = performance.get('cache_embeddings', True)
 
 
 # Global settings instance
@@ -2,5 +2,6 @@
 
 from .embedder import Embedder
 from .vector_store import VectorStore
+from .embedding_cache import EmbeddingCache
 
-__all__ = ['Embedder', 'VectorStore']
+__all__ = ['Embedder', 'VectorStore', 'EmbeddingCache']
@@ -0,0 +1,18 @@
+"""
+CPU Module
+Reports the SIMD features of the host CPU for picking kernels and builds.
+"""
+
+from typing import Dict
+
+
+def cpu_features() -> Dict[str, bool]:
+    """Get the SIMD features numpy detected on this CPU (empty if unavailable)."""
+    try:
+        from numpy._core._multiarray_umath import __cpu_features__
+    except ImportError:
+        try:
+            from numpy.core._multiarray_umath import __cpu_features__
+        except ImportError:
+            return {}
+    return __cpu_features__
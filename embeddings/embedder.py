@@ -5,10 +5,22 @@ Handles text embedding generation using sentence-transformers.
 
 from typing import List, Optional, Union
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 from loguru import logger
 
 from config.settings import config
+from .onnx_embedder import ONNXEncoder, ONNX_AVAILABLE
+
+
+def _pick_device() -> str:
+    """Pick the fastest available device for the embedding model."""
+    if torch.cuda.is_available():
+        return "cuda"
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        return "mps"
+    return "cpu"
 
 
 class Embedder:
@@ -23,36 +35,116 @@ class Embedder:
         
         Args:
             model_name: Name of the sentence-transformers model
-            device: Device to use ('cpu' or 'cuda')
+            device: Device to use ('cpu', 'cuda', 'mps' or 'auto')
         """
         self.model_name = model_name or config.embedding_model
         self.device = device or config.embedding_device
-        self.model: Optional[SentenceTransformer] = None
+        if self.device == "auto":
+            self.device = _pick_device()
+        
+        # GPUs only reach full throughput with larger batches
+        self.batch_size = config.embedding_batch_size
+        if self.device != "cpu":
+            self.batch_size = max(self.batch_size, 128)
+        self.quantize = config.embedding_quantize
+        self.backend = config.embedding_backend
+        self.model: Optional[Union[SentenceTransformer, ONNXEncoder]] = None
         self._embedding_dim: Optional[int] = None
+        # Backend and precision actually in use, set once the model is loaded
+        self._loaded_backend = "torch"
+        self._precision = "fp32"
         
-        logger.info(f"Initializing Embedder with model: {self.model_name}")
+        logger.info(f"Initializing Embedder with model: {self.model_name} on {self.device}")
     
     def load_model(self) -> None:
         """Load the sentence-transformers model."""
         try:
             logger.info(f"Loading embedding model: {self.model_name}")
             
+            if self.backend == "onnx" and self.device == "cpu" and self._load_onnx():
+                self._loaded_backend, self._precision = "onnx", "int8"
+                logger.info(f"ONNX model loaded. Embedding dimension: {self._embedding_dim}")
+                return
+            
             self.model = SentenceTransformer(self.model_name, device=self.device)
             self._embedding_dim = self.model.get_sentence_embedding_dimension()
+            self._loaded_backend, self._precision = "torch", "fp32"
             
-            logger.info(f"Model loaded successfully. Embedding dimension: {self._embedding_dim}")
+            if self.quantize and self.device == "cpu":
+                self._quantize_int8()
+            elif self.quantize and self.device == "cuda":
+                # FP16 weights and activations; encode() casts the output back to float32
+                self.model.half()
+                self._precision = "fp16"
+                logger.info("Embedding model converted to FP16")
             
+            logger.info(f"Model loaded successfully. Embedding dimension: {self._embedding_dim}")
+        
         except Exception as e:
             logger.error(f"Error loading embedding model: {e}")
             raise
     
+    def _load_onnx(self) -> bool:
+        """
+        Load the INT8 ONNX Runtime encoder, exporting it on first use.
+        
+        Returns:
+            True if the ONNX encoder is in use, False to fall back to PyTorch
+        """
+        if not ONNX_AVAILABLE:
+            logger.warning("ONNX backend requested but optimum[onnxruntime] is not installed")
+            return False
+        
+        try:
+            model_dir = ONNXEncoder.cache_dir_for(self.model_name)
+            if not ONNXEncoder.is_exported(model_dir):
+                ONNXEncoder.export(self.model_name, model_dir)
+            
+            self.model = ONNXEncoder(model_dir)
+            self._embedding_dim = self.model.get_sentence_embedding_dimension()
+            return True
+        
+        except Exception as e:
+            logger.warning(f"ONNX backend unavailable, using SentenceTransformer: {e}")
+            self.model = None
+            return False
+    
+    def _quantize_int8(self) -> None:
+        """
+        Apply dynamic INT8 quantization to the transformer's Linear layers.
+        
+        Halves weight memory and uses INT8 GEMM kernels on CPU. Falls back
+        to the FP32 model if quantization fails or changes the output shape.
+        """
+        transformer = self.model[0]
+        fp32_model = transformer.auto_model
+        
+        try:
+            transformer.auto_model = torch.ao.quantization.quantize_dynamic(
+                fp32_model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            
+            probe = self.model.encode(["dimension check"], convert_to_numpy=True)
+            if probe.shape[1] != self._embedding_dim:
+                transformer.auto_model = fp32_model
+                logger.warning("INT8 model changed embedding dimension, using FP32 model")
+                return
+            
+            self._precision = "int8"
+            logger.info("Embedding model quantized to INT8")
+        
+        except Exception as e:
+            # The probe may fail after the INT8 module was installed
+            transformer.auto_model = fp32_model
+            logger.warning(f"INT8 quantization unavailable, using FP32 model: {e}")
+    
     def encode(self, texts: Union[str, List[str]], batch_size: Optional[int] = None) -> np.ndarray:
         """
         Generate embeddings for text(s).
         
         Args:
             texts: Single text string or list of text strings
-            batch_size: Batch size for encoding (uses config default if None)
+            batch_size: Batch size for encoding (uses the device default if None)
             
         Returns:
             numpy array of embeddings (shape: [n_texts, embedding_dim])
@@ -70,7 +162,7 @@ class Embedder:
             return np.array([])
         
         try:
-            batch_size = batch_size or config.embedding_batch_size
+            batch_size = batch_size or self.batch_size
             
             logger.debug(f"Encoding {len(texts)} texts with batch size {batch_size}")
             
@@ -82,10 +174,13 @@ class Embedder:
                 normalize_embeddings=True  # Normalize for cosine similarity
             )
             
+            # FAISS wants float32 C-order; this is a no-op unless the model returned fp16
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+            
             logger.debug(f"Generated embeddings shape: {embeddings.shape}")
             
             return embeddings
-            
+        
         except Exception as e:
             logger.error(f"Error encoding texts: {e}")
             raise
@@ -112,6 +207,18 @@ class Embedder:
             self._embedding_dim = self.model.get_sentence_embedding_dimension()
         return self._embedding_dim
     
+    @property
+    def cache_key(self) -> str:
+        """
+        Identify the model, backend and precision producing the embeddings.
+        
+        INT8, FP16 and ONNX outputs drift slightly from the FP32 model, so
+        cached vectors are only reused for the exact same configuration.
+        """
+        if self.model is None:
+            self.load_model()
+        return f"{self.model_name}|{self._loaded_backend}|{self._precision}"
+    
     def is_loaded(self) -> bool:
         """Check if the model is loaded."""
         return self.model is not None
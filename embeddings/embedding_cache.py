@@ -0,0 +1,116 @@
+"""
+Embedding Cache Module
+Persistent SQLite cache of chunk embeddings keyed by content hash.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from loguru import logger
+
+from config.settings import config
+
+
+class EmbeddingCache:
+    """
+    Content-addressed store for embeddings.
+    Lets re-indexing skip the encoder for chunks that have not changed.
+    """
+    
+    # SQLite limits the number of bound parameters per statement
+    _QUERY_BATCH = 500
+    
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Initialize the embedding cache.
+        
+        Args:
+            cache_path: Path to the SQLite database file
+        """
+        self.cache_path = Path(cache_path or config.embedding_cache_path)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "hash TEXT NOT NULL, model TEXT NOT NULL, dim INTEGER NOT NULL, vec BLOB NOT NULL, "
+            "PRIMARY KEY (hash, model))"
+        )
+        self._conn.commit()
+        
+        logger.info(f"Embedding cache opened at {self.cache_path}")
+    
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """
+        Compute the cache key for a chunk of text.
+        
+        Args:
+            text: Chunk text
+            
+        Returns:
+            SHA-256 hex digest of the text
+        """
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    
+    def get_many(self, hashes: List[str], model: str) -> Dict[str, np.ndarray]:
+        """
+        Look up cached embeddings.
+        
+        Args:
+            hashes: Content hashes to look up
+            model: Name of the model that produced the embeddings
+            
+        Returns:
+            Dictionary mapping each cached hash to its embedding
+        """
+        cached: Dict[str, np.ndarray] = {}
+        unique = list(dict.fromkeys(hashes))
+        
+        for i in range(0, len(unique), self._QUERY_BATCH):
+            batch = unique[i:i + self._QUERY_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT hash, vec FROM cache WHERE model = ? AND hash IN ({placeholders})",
+                [model, *batch]
+            )
+            for key, blob in rows:
+                cached[key] = np.frombuffer(blob, dtype=np.float32)
+        
+        logger.debug(f"Embedding cache hits: {len(cached)}/{len(unique)}")
+        return cached
+    
+    def put_many(self, items: List[Tuple[str, np.ndarray]], model: str) -> None:
+        """
+        Store embeddings in the cache.
+        
+        Args:
+            items: List of (hash, embedding) pairs
+            model: Name of the model that produced the embeddings
+        """
+        if not items:
+            return
+        
+        rows = [
+            (key, model, int(vec.shape[0]), np.asarray(vec, dtype=np.float32).tobytes())
+            for key, vec in items
+        ]
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO cache (hash, model, dim, vec) VALUES (?, ?, ?, ?)",
+            rows
+        )
+        self._conn.commit()
+        
+        logger.debug(f"Stored {len(rows)} embeddings in cache")
+    
+    def clear(self) -> None:
+        """Remove all cached embeddings."""
+        self._conn.execute("DELETE FROM cache")
+        self._conn.commit()
+        logger.info("Embedding cache cleared")
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
@@ -0,0 +1,153 @@
+"""
+ONNX Embedder Module
+Runs the sentence-transformers encoder through ONNX Runtime with INT8 weights.
+"""
+
+import json
+from pathlib import Path
+from typing import List, Union
+import numpy as np
+from loguru import logger
+
+from config.settings import config
+from .cpu import cpu_features
+
+try:
+    from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+    logger.debug("optimum[onnxruntime] not installed - ONNX embedding backend disabled")
+
+
+class ONNXEncoder:
+    """
+    INT8 ONNX Runtime encoder with the same output as the SentenceTransformer model.
+    Exposes the subset of the SentenceTransformer interface used by Embedder.
+    """
+    
+    MODEL_FILE = "model_quantized.onnx"
+    ENCODER_CONFIG = "encoder_config.json"
+    
+    def __init__(self, model_dir: Union[str, Path]):
+        """
+        Load an exported encoder.
+        
+        Args:
+            model_dir: Directory created by export()
+        """
+        self.model_dir = Path(model_dir)
+        
+        with open(self.model_dir / self.ENCODER_CONFIG, 'r', encoding='utf-8') as f:
+            encoder_config = json.load(f)
+        
+        self.max_seq_length = encoder_config['max_seq_length']
+        self.tokenizer = AutoTokenizer.from_pretrained(str(self.model_dir))
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            str(self.model_dir), file_name=self.MODEL_FILE
+        )
+        self._embedding_dim = self.model.config.hidden_size
+        
+        logger.info(f"ONNX encoder loaded from {self.model_dir}")
+    
+    @staticmethod
+    def cache_dir_for(model_name: str) -> Path:
+        """Get the directory the quantized export of a model is cached in."""
+        safe_name = model_name.replace('/', '_').replace('\\', '_')
+        return Path(config.vector_store_path).parent / f"{safe_name}-int8-onnx"
+    
+    @classmethod
+    def is_exported(cls, model_dir: Union[str, Path]) -> bool:
+        """Check if a quantized export exists in the directory."""
+        model_dir = Path(model_dir)
+        return (model_dir / cls.MODEL_FILE).exists() and (model_dir / cls.ENCODER_CONFIG).exists()
+    
+    @classmethod
+    def export(cls, model_name: str, model_dir: Union[str, Path]) -> None:
+        """
+        Export a sentence-transformers model to ONNX and quantize it to INT8.
+        
+        Args:
+            model_name: Name or path of the sentence-transformers model
+            model_dir: Output directory
+        """
+        from sentence_transformers import SentenceTransformer
+        
+        model_dir = Path(model_dir)
+        logger.info(f"Exporting {model_name} to INT8 ONNX at {model_dir}...")
+        
+        # Mean pooling is reimplemented below, so only export models that use it
+        st_model = SentenceTransformer(model_name, device="cpu")
+        pooling = st_model[1]
+        if not getattr(pooling, 'pooling_mode_mean_tokens', False):
+            raise ValueError(f"{model_name} does not use mean pooling")
+        max_seq_length = st_model.max_seq_length
+        del st_model
+        
+        ort_model = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+        
+        # VNNI kernels where available; the AVX2 config avoids u8s8 saturation elsewhere
+        if cpu_features().get('AVX512VNNI'):
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        else:
+            qconfig = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+        
+        quantizer = ORTQuantizer.from_pretrained(ort_model)
+        quantizer.quantize(save_dir=str(model_dir), quantization_config=qconfig)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(str(model_dir))
+        
+        with open(model_dir / cls.ENCODER_CONFIG, 'w', encoding='utf-8') as f:
+            json.dump({'model_name': model_name, 'max_seq_length': max_seq_length}, f)
+        
+        logger.info("ONNX export complete")
+    
+    def encode(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        normalize_embeddings: bool = True,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        Generate mean-pooled embeddings.
+        
+        Args:
+            texts: List of text strings
+            batch_size: Batch size for encoding
+            normalize_embeddings: L2-normalize the output vectors
+            
+        Returns:
+            numpy array of embeddings (shape: [n_texts, embedding_dim])
+        """
+        embeddings = np.empty((len(texts), self._embedding_dim), dtype=np.float32)
+        
+        # Length-sorted batches keep padding to a minimum
+        order = np.argsort([-len(text) for text in texts], kind='stable')
+        
+        for start in range(0, len(texts), batch_size):
+            batch_idx = order[start:start + batch_size]
+            inputs = self.tokenizer(
+                [texts[i] for i in batch_idx],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np"
+            )
+            token_embeddings = self.model(**inputs).last_hidden_state
+            
+            # Mean pooling over non-padding tokens
+            mask = inputs['attention_mask'][..., None].astype(np.float32)
+            summed = (token_embeddings * mask).sum(axis=1)
+            embeddings[batch_idx] = summed / np.clip(mask.sum(axis=1), 1e-9, None)
+        
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.clip(norms, 1e-12, None)
+        
+        return embeddings
+    
+    def get_sentence_embedding_dimension(self) -> int:
+        """Get the dimension of the embeddings."""
+        return self._embedding_dim
@@ -4,6 +4,7 @@ Handles FAISS-based vector database for efficient similarity search.
 """
 
 import os
+import json
 import pickle
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
@@ -12,48 +13,196 @@ import faiss
 from loguru import logger
 
 from config.settings import config
+from .cpu import cpu_features
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    logger.debug("msgpack not installed - document metadata stored as JSON Lines")
+
+
+_faiss_configured = False
+
+
+def _configure_faiss() -> None:
+    """Size the FAISS OpenMP pool and warn if its build lacks the CPU's SIMD kernels."""
+    global _faiss_configured
+    if _faiss_configured:
+        return
+    _faiss_configured = True
+    
+    num_threads = config.performance_num_threads
+    if num_threads <= 0:
+        # Half the logical CPUs approximates the physical core count
+        num_threads = max(1, (os.cpu_count() or 1) // 2)
+    faiss.omp_set_num_threads(num_threads)
+    
+    compile_options = faiss.get_compile_options().split()
+    features = cpu_features()
+    
+    if features.get('AVX512F') and 'AVX512' not in compile_options:
+        logger.warning("CPU supports AVX-512 but FAISS was built without it; install a newer faiss-cpu wheel")
+    elif features.get('AVX2') and 'AVX2' not in compile_options:
+        logger.warning("CPU supports AVX2 but FAISS was built without it; search will be slower")
+    
+    logger.info(f"FAISS using {num_threads} threads ({' '.join(compile_options)})")
 
 
 class VectorStore:
     """
     FAISS-based vector store for efficient semantic search.
     Supports saving/loading and incremental updates.
+    
+    Small corpora use an 8-bit scalar-quantized index. Large corpora use a tiered
+    layout: a compressed IVF-PQ cold tier holding the bulk of the vectors
+    and an HNSW hot tier receiving documents added after the initial build.
     """
     
-    def __init__(self, index_path: Optional[str] = None, dimension: Optional[int] = None):
+    # HNSW graph degree for the hot tier
+    HNSW_M = 16
+    
+    # Number of inverted lists probed per query in the cold tier
+    COLD_NPROBE = 16
+    
+    # Hot tier size at which its vectors are folded into the cold tier
+    HOT_TIER_CAPACITY = 20000
+    
+    # Loaded indexes are memory-mapped so vectors are paged in on demand.
+    # IO_FLAG_MMAP only maps IVF inverted lists; MMAP_IFC also maps flat,
+    # scalar-quantized and HNSW storage.
+    MMAP_FLAGS = faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY
+    
+    def __init__(
+        self,
+        index_path: Optional[str] = None,
+        dimension: Optional[int] = None,
+        assume_normalized: bool = False
+    ):
         """
         Initialize the vector store.
         
         Args:
             index_path: Path to save/load the FAISS index
             dimension: Dimension of the embedding vectors
+            assume_normalized: Skip L2 normalization of incoming vectors
+                (e.g. when the embedder already normalizes them)
         """
+        _configure_faiss()
+        
         self.index_path = Path(index_path or config.vector_store_path)
         self.dimension = dimension or config.vector_dimension
+        self.tiered_threshold = config.vector_tiered_threshold
+        self.assume_normalized = assume_normalized
         self.index: Optional[faiss.Index] = None
+        self.cold_index: Optional[faiss.Index] = None
         self.documents: List[Dict] = []
         self._is_trained = False
+        self._is_mmapped = False
+        
+        # Number of leading documents already written to the docs log
+        self._docs_persisted = 0
+        # Sources attached to already-written documents, appended on next save
+        self._pending_aliases: List[Dict] = []
         
         logger.info(f"Vector store initialized with dimension: {self.dimension}")
     
-    def create_index(self) -> None:
-        """Create a new FAISS index for cosine similarity search."""
+    def create_index(self, expected_size: Optional[int] = None) -> None:
+        """
+        Create a new FAISS index for cosine similarity search.
+        
+        Args:
+            expected_size: Expected number of vectors. Corpora larger than
+                the tiered threshold get an HNSW hot tier plus an IVF-PQ
+                cold tier; otherwise a scalar-quantized flat index is used,
+                which is promoted to the tiered layout once it outgrows
+                the threshold.
+        """
         try:
             logger.info("Creating FAISS index...")
             
-            # Use IndexFlatIP for inner product (cosine similarity with normalized vectors)
-            self.index = faiss.IndexFlatIP(self.dimension)
+            self.cold_index = None
+            self._is_mmapped = False
             
-            # Optionally wrap with IDMap for deletion support
-            self.index = faiss.IndexIDMap(self.index)
+            if expected_size is not None and expected_size > self.tiered_threshold:
+                self.index, self.cold_index = self._build_tiers(expected_size)
+                logger.info(f"Using tiered index (HNSW hot + IVF-PQ cold) for {expected_size} vectors")
+            else:
+                # 8-bit scalar quantizer: inner product on int8 codes, 4x smaller than float32
+                sq = faiss.IndexScalarQuantizer(
+                    self.dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+                )
+                
+                # Normalized vectors have every component in [-1, 1], so train on that
+                # range instead of on whichever batch happens to be added first
+                bounds = np.vstack([
+                    np.full(self.dimension, -1.0, dtype=np.float32),
+                    np.full(self.dimension, 1.0, dtype=np.float32)
+                ])
+                sq.train(bounds)
+                
+                # Optionally wrap with IDMap for deletion support
+                self.index = faiss.IndexIDMap(sq)
             
             self._is_trained = True
             logger.info("FAISS index created successfully")
-            
+        
         except Exception as e:
             logger.error(f"Error creating FAISS index: {e}")
             raise
     
+    def _build_tiers(self, expected_size: int) -> Tuple[faiss.Index, faiss.Index]:
+        """
+        Build an empty HNSW hot tier and an untrained IVF-PQ cold tier.
+        
+        Args:
+            expected_size: Expected number of vectors, used to size the cold tier
+            
+        Returns:
+            Tuple of (hot_index, cold_index)
+        """
+        # Hot tier: HNSW graph, no training needed, O(log N) lookups
+        hot = faiss.IndexIDMap2(
+            faiss.IndexHNSWFlat(self.dimension, self.HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        )
+        
+        # Cold tier: IVF-PQ, 8 bytes per vector, trained on first bulk add
+        nlist = int(min(4096, max(1, 4 * np.sqrt(expected_size))))
+        cold = faiss.index_factory(
+            self.dimension, f"IVF{nlist},PQ8x8", faiss.METRIC_INNER_PRODUCT
+        )
+        return hot, cold
+    
+    @property
+    def is_tiered(self) -> bool:
+        """Check if the store uses the hot/cold tiered layout."""
+        return self.cold_index is not None
+    
+    @staticmethod
+    def _can_train_cold(cold_index: faiss.Index, num_vectors: int) -> bool:
+        """Check if enough vectors are available to train a cold tier."""
+        nlist = faiss.extract_index_ivf(cold_index).nlist
+        
+        # Both the coarse quantizer and the 256-entry PQ codebooks need a point per centroid
+        return num_vectors >= max(nlist, 256)
+    
+    def _train_cold_index(self, cold_index: faiss.Index, embeddings: np.ndarray) -> None:
+        """Train a cold tier on a random subsample of embeddings."""
+        ivf = faiss.extract_index_ivf(cold_index)
+        
+        # FAISS uses at most 256 training points per centroid
+        max_train = ivf.nlist * 256
+        if len(embeddings) > max_train:
+            sample = np.random.default_rng(0).choice(len(embeddings), max_train, replace=False)
+            train_set = embeddings[np.sort(sample)]
+        else:
+            train_set = embeddings
+        
+        logger.info(f"Training cold tier on {len(train_set)} vectors...")
+        cold_index.train(train_set)
+        ivf.nprobe = self.COLD_NPROBE
+    
     def add_documents(self, embeddings: np.ndarray, documents: List[Dict]) -> None:
         """
         Add documents and their embeddings to the index.
@@ -69,74 +218,366 @@ class VectorStore:
         if len(embeddings) != len(documents):
             raise ValueError("Number of embeddings must match number of documents")
         
+        if self._is_mmapped:
+            self._reopen_writable()
+        
         try:
-            # Convert to float32 if needed
-            if embeddings.dtype != np.float32:
-                embeddings = embeddings.astype(np.float32)
+            # Embedder output is already float32 C-order, so this does not copy
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
             
             # Normalize embeddings for cosine similarity
-            faiss.normalize_L2(embeddings)
+            self._normalize(embeddings)
             
             # Generate IDs
             start_id = len(self.documents)
             ids = np.arange(start_id, start_id + len(documents), dtype=np.int64)
             
             # Add to index
-            self.index.add_with_ids(embeddings, ids)
+            if self.is_tiered:
+                if not self.cold_index.is_trained and self._can_train_cold(self.cold_index, len(embeddings)):
+                    self._train_cold_index(self.cold_index, embeddings)
+                
+                # Bulk build goes to the cold tier, later additions to the hot tier
+                if self.cold_index.is_trained and self.cold_index.ntotal == 0:
+                    self.cold_index.add_with_ids(embeddings, ids)
+                else:
+                    self.index.add_with_ids(embeddings, ids)
+                    if self.index.ntotal >= self.HOT_TIER_CAPACITY:
+                        self._compact_hot_tier()
+            else:
+                self.index.add_with_ids(embeddings, ids)
+                if self.index.ntotal > self.tiered_threshold:
+                    self._promote_to_tiered()
             
             # Store documents
             self.documents.extend(documents)
             
-            logger.info(f"Added {len(documents)} documents to index. Total: {len(self.documents)}")
-            
+            logger.debug(f"Added {len(documents)} documents to index. Total: {len(self.documents)}")
+        
         except Exception as e:
             logger.error(f"Error adding documents to index: {e}")
             raise
     
-    def search(self, query_embedding: np.ndarray, top_k: int = 5) -> List[Tuple[Dict, float]]:
+    def _normalize(self, vectors: np.ndarray) -> None:
+        """L2-normalize vectors in place unless they are known to be unit length."""
+        if self.assume_normalized and len(vectors):
+            # Checking a single row is O(d) and catches callers passing raw vectors
+            if np.isclose(np.linalg.norm(vectors[0]), 1.0, atol=1e-3):
+                return
+            logger.warning("Vectors are not unit length despite assume_normalized, normalizing")
+        
+        faiss.normalize_L2(vectors)
+    
+    def add_sources(self, doc_id: int, sources: List[Dict]) -> None:
+        """
+        Record extra sources for a document whose text appears in several places.
+        
+        Args:
+            doc_id: Position of the document in the store
+            sources: Metadata dictionaries of the duplicate chunks
+        """
+        self.documents[doc_id].setdefault('sources', []).extend(sources)
+        
+        # Documents already in the log get an alias record instead of a rewrite
+        if doc_id < self._docs_persisted:
+            self._pending_aliases.append({'_alias_of': doc_id, 'sources': sources})
+    
+    def _promote_to_tiered(self) -> None:
+        """
+        Convert the flat index to the tiered layout once it outgrows the threshold.
+        
+        Incremental builds do not know the final corpus size up front, so the
+        cold tier is trained on the vectors decoded from the flat index. The
+        flat index stays in place until the new tiers are fully built, and
+        promotion waits while there are too few vectors to train the cold tier.
+        """
+        flat = self.index
+        vectors = flat.index.reconstruct_n(0, flat.ntotal)
+        ids = faiss.vector_to_array(flat.id_map).astype(np.int64)
+        
+        hot, cold = self._build_tiers(len(vectors))
+        if not self._can_train_cold(cold, len(vectors)):
+            logger.debug(f"Too few vectors ({len(vectors)}) to train the cold tier, staying flat")
+            return
+        
+        logger.info(f"Flat index exceeded {self.tiered_threshold} vectors, promoting to tiered layout")
+        self._train_cold_index(cold, vectors)
+        cold.add_with_ids(vectors, ids)
+        
+        self.index, self.cold_index = hot, cold
+    
+    def _compact_hot_tier(self) -> None:
+        """Move all hot-tier vectors into the cold tier, training it first if needed."""
+        vectors = self.index.index.reconstruct_n(0, self.index.ntotal)
+        ids = faiss.vector_to_array(self.index.id_map).astype(np.int64)
+        
+        if not self.cold_index.is_trained:
+            if not self._can_train_cold(self.cold_index, len(vectors)):
+                return
+            self._train_cold_index(self.cold_index, vectors)
+        
+        logger.info(f"Compacting {len(vectors)} hot-tier vectors into the cold tier")
+        self.cold_index.add_with_ids(vectors, ids)
+        self.index.reset()
+    
+    def search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 5,
+        min_score: Optional[float] = None
+    ) -> List[Tuple[Dict, float]]:
         """
         Search for similar documents.
         
         Args:
             query_embedding: Query embedding vector
             top_k: Number of top results to return
+            min_score: Drop results with a lower similarity score
             
         Returns:
             List of tuples (document, similarity_score)
         """
+        # Ensure query is 2D
+        if query_embedding.ndim == 1:
+            query_embedding = query_embedding.reshape(1, -1)
+        
+        return self.search_batch(query_embedding[:1], top_k, min_score)[0]
+    
+    def search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        top_k: int = 5,
+        min_score: Optional[float] = None
+    ) -> List[List[Tuple[Dict, float]]]:
+        """
+        Search for similar documents for several queries in one FAISS call.
+        
+        Args:
+            query_embeddings: Query embeddings (shape: [n_queries, dimension])
+            top_k: Number of top results to return per query
+            min_score: Drop results with a lower similarity score
+            
+        Returns:
+            One list of (document, similarity_score) tuples per query
+        """
         if self.index is None or len(self.documents) == 0:
             logger.warning("Index is empty or not created")
-            return []
+            return [[] for _ in range(len(query_embeddings))]
         
         try:
-            # Ensure query is 2D and float32
-            if query_embedding.ndim == 1:
-                query_embedding = query_embedding.reshape(1, -1)
-            
-            if query_embedding.dtype != np.float32:
-                query_embedding = query_embedding.astype(np.float32)
+            query_embeddings = np.ascontiguousarray(query_embeddings, dtype=np.float32)
             
-            # Normalize query
-            faiss.normalize_L2(query_embedding)
+            # Normalize queries
+            self._normalize(query_embeddings)
             
             # Search
             top_k = min(top_k, len(self.documents))
-            distances, indices = self.index.search(query_embedding, top_k)
+            distances, indices = self._search_tiers(query_embeddings, top_k)
             
-            # Prepare results
-            results = []
-            for dist, idx in zip(distances[0], indices[0]):
-                if idx >= 0 and idx < len(self.documents):
-                    # Distance is inner product (higher is better for cosine similarity)
-                    similarity_score = float(dist)
-                    results.append((self.documents[idx], similarity_score))
+            # Drop missing hits and low scores before building any Python tuples;
+            # distance is inner product (higher is better for cosine similarity)
+            keep = (indices >= 0) & (indices < len(self.documents))
+            if min_score is not None:
+                keep &= distances >= min_score
             
-            logger.debug(f"Search returned {len(results)} results")
-            return results
+            # Prepare results
+            batch_results = [
+                [
+                    (self.documents[idx], dist)
+                    for idx, dist in zip(row_indices[row_keep].tolist(), row_distances[row_keep].tolist())
+                ]
+                for row_distances, row_indices, row_keep in zip(distances, indices, keep)
+            ]
             
+            logger.opt(lazy=True).debug(
+                "Search returned {} results for {} queries",
+                lambda: sum(len(r) for r in batch_results),
+                lambda: len(batch_results)
+            )
+            return batch_results
+        
         except Exception as e:
             logger.error(f"Error searching index: {e}")
-            return []
+            return [[] for _ in range(len(query_embeddings))]
+    
+    def _search_tiers(self, query_embedding: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search the hot and cold tiers and merge their top_k by score.
+        
+        Args:
+            query_embedding: 2D float32 query array
+            top_k: Number of results to return
+            
+        Returns:
+            Tuple of (scores, ids) arrays, each shape [n_queries, top_k]
+        """
+        if not self.is_tiered:
+            return self.index.search(query_embedding, top_k)
+        
+        tiers = [tier for tier in (self.index, self.cold_index) if tier.ntotal > 0]
+        if len(tiers) == 1:
+            return tiers[0].search(query_embedding, top_k)
+        
+        # Missing slots are returned as (-inf, -1) and sort to the end
+        hits = [tier.search(query_embedding, top_k) for tier in tiers]
+        distances = np.concatenate([d for d, _ in hits], axis=1)
+        indices = np.concatenate([i for _, i in hits], axis=1)
+        
+        order = np.argsort(-distances, axis=1)[:, :top_k]
+        return (
+            np.take_along_axis(distances, order, axis=1),
+            np.take_along_axis(indices, order, axis=1)
+        )
+    
+    def _read_index_files(self, flags: int = 0) -> None:
+        """
+        Read the index for the layout found on disk.
+        
+        Args:
+            flags: FAISS IO flags passed to read_index
+        """
+        files = self._index_files()
+        
+        if os.path.exists(files['hot']) and os.path.exists(files['cold']):
+            self.index, hot_mapped = self._read_index(files['hot'], flags)
+            self.cold_index, cold_mapped = self._read_index(files['cold'], flags)
+            if self.cold_index.is_trained:
+                faiss.extract_index_ivf(self.cold_index).nprobe = self.COLD_NPROBE
+            self._is_mmapped = hot_mapped or cold_mapped
+        else:
+            self.index, self._is_mmapped = self._read_index(files['flat'], flags)
+            self.cold_index = None
+    
+    @staticmethod
+    def _read_index(path: str, flags: int) -> Tuple[faiss.Index, bool]:
+        """
+        Read one index file, falling back to RAM if it cannot be mapped.
+        
+        Args:
+            path: Index file path
+            flags: FAISS IO flags passed to read_index
+            
+        Returns:
+            Tuple of (index, whether its storage is memory-mapped)
+        """
+        if flags & faiss.IO_FLAG_MMAP_IFC:
+            try:
+                return faiss.read_index(path, flags), True
+            except RuntimeError as e:
+                logger.warning(f"Memory-mapping {path} failed, reading it into RAM: {e}")
+        return faiss.read_index(path), False
+    
+    def _reopen_writable(self) -> None:
+        """Re-read a memory-mapped index into RAM so it can be appended to."""
+        logger.info("Reopening memory-mapped index for writing")
+        self._read_index_files()
+    
+    @staticmethod
+    def _write_index_atomic(index: faiss.Index, path: str) -> None:
+        """Write an index via a temp file so a mapped copy is never truncated."""
+        tmp_path = path + ".tmp"
+        faiss.write_index(index, tmp_path)
+        os.replace(tmp_path, path)
+    
+    def _index_files(self, index_path: Optional[Path] = None) -> Dict[str, str]:
+        """Get the on-disk file names for each index layout (own path if None)."""
+        base = str(index_path or self.index_path)
+        return {
+            'flat': base + ".index",
+            'hot': base + ".hot",
+            'cold': base + ".cold"
+        }
+    
+    def _docs_files(self, index_path: Optional[Path] = None) -> Dict[str, str]:
+        """Get the on-disk file names for document metadata (own path if None)."""
+        base = str(index_path or self.index_path)
+        return {
+            'msgpack': base + ".docs.msgpack",
+            'jsonl': base + ".docs.jsonl",
+            'legacy': base + ".docs"
+        }
+    
+    @staticmethod
+    def _log_format() -> str:
+        """Get the format new document logs are written in."""
+        return 'msgpack' if MSGPACK_AVAILABLE else 'jsonl'
+    
+    @staticmethod
+    def _encode_documents(documents: List[Dict], fmt: str) -> bytes:
+        """Serialize documents as concatenated log records."""
+        if fmt == 'msgpack':
+            return b"".join(msgpack.packb(doc, use_bin_type=True) for doc in documents)
+        return "".join(json.dumps(doc, ensure_ascii=False) + "\n" for doc in documents).encode('utf-8')
+    
+    def _write_documents(self) -> None:
+        """
+        Persist document metadata as an append-only log.
+        
+        Records are msgpack-encoded, or JSON Lines when msgpack is not
+        installed. Only documents added since the last save are written.
+        After a clear, or when loading another format, the log is rewritten
+        from scratch via a temp file.
+        """
+        files = self._docs_files()
+        fmt = self._log_format()
+        log_path = files[fmt]
+        records = self.documents[self._docs_persisted:]
+        if self._docs_persisted > 0:
+            records = self._pending_aliases + records
+        data = self._encode_documents(records, fmt)
+        
+        if self._docs_persisted == 0:
+            tmp_path = log_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, log_path)
+            
+            # Remove metadata left over in other formats
+            for name, path in files.items():
+                if name != fmt and os.path.exists(path):
+                    os.remove(path)
+        elif data:
+            with open(log_path, 'ab') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+        
+        self._docs_persisted = len(self.documents)
+        self._pending_aliases = []
+    
+    def _read_documents(self) -> List[Dict]:
+        """Read document metadata from the log found on disk."""
+        files = self._docs_files()
+        
+        if MSGPACK_AVAILABLE and os.path.exists(files['msgpack']):
+            with open(files['msgpack'], 'rb') as f:
+                records = list(msgpack.Unpacker(f, raw=False))
+        elif os.path.exists(files['jsonl']):
+            with open(files['jsonl'], 'rb') as f:
+                records = [json.loads(line) for line in f if line.strip()]
+        else:
+            # Older indexes pickled the whole list
+            with open(files['legacy'], 'rb') as f:
+                documents = pickle.load(f)
+            self._docs_persisted = 0
+            return documents
+        
+        # Fold alias records into the documents they point at
+        documents = []
+        for record in records:
+            if '_alias_of' in record:
+                documents[record['_alias_of']].setdefault('sources', []).extend(record['sources'])
+            else:
+                documents.append(record)
+        
+        # Appending is only possible to a log in the current write format
+        if os.path.exists(files[self._log_format()]):
+            self._docs_persisted = len(documents)
+        else:
+            self._docs_persisted = 0
+        return documents
     
     def save(self) -> None:
         """Save the index and documents to disk."""
@@ -144,17 +585,25 @@ class VectorStore:
             # Create directory if it doesn't exist
             self.index_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Save FAISS index
-            index_file = str(self.index_path) + ".index"
-            faiss.write_index(self.index, index_file)
+            # Save FAISS index, removing files left over from the other layout
+            files = self._index_files()
+            if self.is_tiered:
+                self._write_index_atomic(self.index, files['hot'])
+                self._write_index_atomic(self.cold_index, files['cold'])
+                stale = [files['flat']]
+            else:
+                self._write_index_atomic(self.index, files['flat'])
+                stale = [files['hot'], files['cold']]
             
-            # Save documents metadata
-            docs_file = str(self.index_path) + ".docs"
-            with open(docs_file, 'wb') as f:
-                pickle.dump(self.documents, f)
+            for stale_file in stale:
+                if os.path.exists(stale_file):
+                    os.remove(stale_file)
             
-            logger.info(f"Vector store saved to {self.index_path}")
+            # Append new documents to the metadata log
+            self._write_documents()
             
+            logger.info(f"Vector store saved to {self.index_path}")
+        
         except Exception as e:
             logger.error(f"Error saving vector store: {e}")
             raise
@@ -167,34 +616,77 @@ class VectorStore:
             True if loaded successfully, False otherwise
         """
         try:
-            index_file = str(self.index_path) + ".index"
-            docs_file = str(self.index_path) + ".docs"
+            files = self._index_files()
+            docs_files = self._docs_files()
+            tiered = os.path.exists(files['hot']) and os.path.exists(files['cold'])
+            has_docs = any(os.path.exists(path) for path in docs_files.values())
             
-            if not os.path.exists(index_file) or not os.path.exists(docs_file):
+            if not (tiered or os.path.exists(files['flat'])) or not has_docs:
                 logger.warning(f"Index files not found at {self.index_path}")
                 return False
             
-            # Load FAISS index
-            self.index = faiss.read_index(index_file)
+            # Memory-map the FAISS index instead of reading it into RAM
+            self._read_index_files(self.MMAP_FLAGS)
             
             # Load documents
-            with open(docs_file, 'rb') as f:
-                self.documents = pickle.load(f)
+            self.documents = self._read_documents()
+            
+            # Drop log entries for vectors that never made it into the index
+            num_vectors = self.index.ntotal + (self.cold_index.ntotal if self.is_tiered else 0)
+            if len(self.documents) > num_vectors:
+                logger.warning(f"Docs log has {len(self.documents)} entries for {num_vectors} vectors, truncating")
+                self.documents = self.documents[:num_vectors]
+                self._docs_persisted = 0
             
             self._is_trained = True
             logger.info(f"Vector store loaded from {self.index_path}. Documents: {len(self.documents)}")
             
             return True
-            
+        
         except Exception as e:
             logger.error(f"Error loading vector store: {e}")
             return False
     
+    def _all_files(self, index_path: Optional[Path] = None) -> List[str]:
+        """Get every file name a store at index_path may have on disk."""
+        return list(self._index_files(index_path).values()) + list(self._docs_files(index_path).values())
+    
+    def move_files(self, index_path: str) -> None:
+        """
+        Move the saved index to another path, replacing the index stored there.
+        
+        Files of the other layout or metadata format left at the target are
+        removed, so the target holds exactly this store afterwards. Replacing
+        keeps memory-mapped readers of the old files valid.
+        
+        Args:
+            index_path: Destination index path
+        """
+        for src, dst in zip(self._all_files(), self._all_files(Path(index_path))):
+            if os.path.exists(src):
+                os.replace(src, dst)
+            elif os.path.exists(dst):
+                os.remove(dst)
+        
+        self.index_path = Path(index_path)
+        logger.info(f"Vector store moved to {self.index_path}")
+    
+    def delete_files(self) -> None:
+        """Remove this store's files from disk."""
+        for path in self._all_files():
+            for candidate in (path, path + ".tmp"):
+                if os.path.exists(candidate):
+                    os.remove(candidate)
+    
     def clear(self) -> None:
         """Clear the index and all documents."""
         self.index = None
+        self.cold_index = None
         self.documents = []
         self._is_trained = False
+        self._is_mmapped = False
+        self._docs_persisted = 0
+        self._pending_aliases = []
         logger.info("Vector store cleared")
     
     def get_stats(self) -> Dict:
@@ -208,5 +700,8 @@ class VectorStore:
             'num_documents': len(self.documents),
             'dimension': self.dimension,
             'is_trained': self._is_trained,
+            'is_tiered': self.is_tiered,
+            'hot_documents': self.index.ntotal if self.is_tiered else 0,
+            'cold_documents': self.cold_index.ntotal if self.is_tiered else 0,
             'index_path': str(self.index_path)
         }
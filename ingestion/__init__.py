@@ -3,5 +3,6 @@
 from .pdf_reader import PDFReader
 from .docx_reader import DOCXReader
 from .chunker import TextChunker
+from .pipeline import extract_and_chunk
 
-__all__ = ['PDFReader', 'DOCXReader', 'TextChunker']
+__all__ = ['PDFReader', 'DOCXReader', 'TextChunker', 'extract_and_chunk']
@@ -3,11 +3,16 @@ Text Chunker Module
 Intelligently splits text into semantic chunks for embedding.
 """
 
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict
 import re
 from loguru import logger
 
 
+# Sentence boundary patterns
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+_PARAGRAPH_RE = re.compile(r'\n\s*\n')
+
+
 class TextChunker:
     """
     Intelligently chunks text into semantic segments.
@@ -24,10 +29,6 @@ class TextChunker:
         """
         self.chunk_size = chunk_size
         self.overlap = overlap
-        
-        # Sentence boundary patterns
-        self.sentence_pattern = re.compile(r'(?<=[.!?])\s+')
-        self.paragraph_pattern = re.compile(r'\n\s*\n')
     
     def chunk_text(self, text: str, metadata: Dict = None) -> List[Dict]:
         """
@@ -44,16 +45,61 @@ class TextChunker:
             logger.warning("Empty text provided to chunker")
             return []
         
-        logger.info(f"Chunking text of length {len(text)}")
+        logger.debug(f"Chunking text of length {len(text)}")
+        
+        return self.chunk_stream([text], metadata)
+    
+    def chunk_stream(self, texts: Iterable[str], metadata: Dict = None, joiner: str = "\n") -> List[Dict]:
+        """
+        Chunk text that arrives in pieces, e.g. one PDF page at a time.
+        
+        Produces the same chunks as chunk_text(joiner.join(texts)) without
+        building the joined string; only the paragraph that is still open at the
+        end of a piece is carried over to the next one.
         
-        # First split by paragraphs
-        paragraphs = self.paragraph_pattern.split(text)
-        paragraphs = [p.strip() for p in paragraphs if p.strip()]
+        Args:
+            texts: Iterable of text pieces in document order
+            metadata: Optional metadata to attach to each chunk
+            joiner: String the pieces would be joined with
+            
+        Returns:
+            List of dictionaries containing chunk text and metadata
+        """
+        paragraphs = (
+            stripped for p in self._iter_paragraphs(texts, joiner) if (stripped := p.strip())
+        )
         
         chunks = []
-        current_chunk = ""
         chunk_index = 0
         
+        # Current chunk is accumulated as parts and joined once when flushed
+        current_parts: List[str] = []
+        current_len = 0
+        
+        def add_piece(piece: str, separator: str) -> None:
+            """Append a sentence/paragraph, flushing the current chunk if it would overflow."""
+            nonlocal current_parts, current_len, chunk_index
+            
+            if current_len + len(piece) > self.chunk_size:
+                if current_parts:
+                    current_chunk = "".join(current_parts)
+                    chunks.append(self._create_chunk(current_chunk, chunk_index, metadata))
+                    chunk_index += 1
+                    # Start new chunk with overlap
+                    overlap = self._get_overlap(current_chunk)
+                    current_parts = [overlap, piece]
+                    current_len = len(overlap) + len(piece)
+                else:
+                    current_parts = [piece]
+                    current_len = len(piece)
+            elif current_parts:
+                current_parts.append(separator)
+                current_parts.append(piece)
+                current_len += len(separator) + len(piece)
+            else:
+                current_parts = [piece]
+                current_len = len(piece)
+        
         for paragraph in paragraphs:
             # If paragraph is too long, split into sentences
             if len(paragraph) > self.chunk_size:
@@ -68,49 +114,57 @@ class TextChunker:
                             chunk_index += 1
                     else:
                         # Add sentence to current chunk
-                        if len(current_chunk) + len(sentence) > self.chunk_size:
-                            if current_chunk:
-                                chunks.append(self._create_chunk(current_chunk, chunk_index, metadata))
-                                chunk_index += 1
-                                # Start new chunk with overlap
-                                current_chunk = self._get_overlap(current_chunk) + sentence
-                            else:
-                                current_chunk = sentence
-                        else:
-                            current_chunk += " " + sentence if current_chunk else sentence
+                        add_piece(sentence, " ")
             else:
                 # Add paragraph to current chunk
-                if len(current_chunk) + len(paragraph) > self.chunk_size:
-                    if current_chunk:
-                        chunks.append(self._create_chunk(current_chunk, chunk_index, metadata))
-                        chunk_index += 1
-                        # Start new chunk with overlap
-                        current_chunk = self._get_overlap(current_chunk) + paragraph
-                    else:
-                        current_chunk = paragraph
-                else:
-                    current_chunk += "\n\n" + paragraph if current_chunk else paragraph
+                add_piece(paragraph, "\n\n")
         
         # Add final chunk
-        if current_chunk:
-            chunks.append(self._create_chunk(current_chunk, chunk_index, metadata))
+        if current_parts:
+            chunks.append(self._create_chunk("".join(current_parts), chunk_index, metadata))
         
-        logger.info(f"Created {len(chunks)} chunks")
+        logger.debug(f"Created {len(chunks)} chunks")
         return chunks
     
+    def _iter_paragraphs(self, texts: Iterable[str], joiner: str) -> Iterator[str]:
+        """Yield raw paragraphs of the joined texts, one piece at a time."""
+        pending: List[str] = []  # Pieces of the paragraph still open
+        
+        for i, text in enumerate(texts):
+            if i:
+                text = joiner + text
+            
+            # Trailing whitespace of the open paragraph may form a break with this piece
+            if pending:
+                tail = pending[-1]
+                stripped = tail.rstrip()
+                if len(stripped) < len(tail):
+                    pending[-1] = stripped
+                    text = tail[len(stripped):] + text
+            
+            parts = _PARAGRAPH_RE.split(text)
+            if len(parts) == 1:
+                pending.append(text)
+                continue
+            
+            pending.append(parts[0])
+            yield "".join(pending)
+            yield from parts[1:-1]
+            pending = [parts[-1]]
+        
+        if pending:
+            yield "".join(pending)
+    
     def _split_sentences(self, text: str) -> List[str]:
         """Split text into sentences."""
-        sentences = self.sentence_pattern.split(text)
-        return [s.strip() for s in sentences if s.strip()]
+        sentences = _SENTENCE_RE.split(text)
+        return [stripped for s in sentences if (stripped := s.strip())]
     
     def _force_split(self, text: str) -> List[str]:
         """Force split text that's too long even for a single chunk."""
-        chunks = []
-        for i in range(0, len(text), self.chunk_size - self.overlap):
-            chunk = text[i:i + self.chunk_size]
-            if chunk:
-                chunks.append(chunk)
-        return chunks
+        # Every start is below len(text), so no slice is empty
+        step = self.chunk_size - self.overlap
+        return [text[start:start + self.chunk_size] for start in range(0, len(text), step)]
     
     def _get_overlap(self, text: str) -> str:
         """Get overlap text from the end of the current chunk."""
@@ -130,8 +184,9 @@ class TextChunker:
         Returns:
             Dictionary with chunk data
         """
+        text = text.strip()
         chunk_data = {
-            'text': text.strip(),
+            'text': text,
             'chunk_index': index,
             'char_count': len(text)
         }
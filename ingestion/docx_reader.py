@@ -4,7 +4,7 @@ Handles extraction of text from Microsoft Word documents.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from docx import Document
 from loguru import logger
 
@@ -27,32 +27,41 @@ class DOCXReader:
             Extracted text content or None if extraction fails
         """
         try:
-            logger.info(f"Extracting text from DOCX: {file_path.name}")
+            logger.debug(f"Extracting text from DOCX: {file_path.name}")
             
             doc = Document(str(file_path))
-            text_parts = []
             
-            # Extract text from paragraphs
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    text_parts.append(para.text)
+            full_text = "\n".join(self._iter_text(doc))
+            logger.debug(f"Successfully extracted {len(full_text)} characters from {file_path.name}")
             
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text_parts.append(cell.text)
-            
-            full_text = "\n".join(text_parts)
-            logger.info(f"Successfully extracted {len(full_text)} characters from {file_path.name}")
-            
-            return full_text if full_text.strip() else None
+            # Only non-blank parts are joined, so any text at all is real content
+            return full_text or None
             
         except Exception as e:
             logger.error(f"Error extracting text from DOCX {file_path.name}: {e}")
             return None
     
+    @staticmethod
+    def _iter_text(doc) -> Iterator[str]:
+        """
+        Yield the non-empty paragraph texts, then the non-empty table cell texts.
+        
+        Each .text property walks the underlying XML, so it is read once per element.
+        """
+        # Extract text from paragraphs
+        for para in doc.paragraphs:
+            text = para.text
+            if text and not text.isspace():
+                yield text
+        
+        # Extract text from tables
+        for table in doc.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    text = cell.text
+                    if text and not text.isspace():
+                        yield text
+    
     def extract_metadata(self, file_path: Path) -> dict:
         """
         Extract metadata from a DOCX file.
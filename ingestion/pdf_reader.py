@@ -4,7 +4,7 @@ Handles extraction of text from PDF files.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import fitz  # PyMuPDF
 from loguru import logger
 
@@ -26,28 +26,37 @@ class PDFReader:
         Returns:
             Extracted text content or None if extraction fails
         """
-        try:
-            logger.info(f"Extracting text from PDF: {file_path.name}")
-            
-            doc = fitz.open(str(file_path))
-            text_parts = []
-            
-            for page_num, page in enumerate(doc, 1):
-                text = page.get_text("text")
-                if text.strip():
-                    text_parts.append(text)
-                    logger.debug(f"Extracted {len(text)} chars from page {page_num}")
-            
-            doc.close()
+        full_text = "\n".join(self.iter_pages(file_path))
+        logger.debug(f"Successfully extracted {len(full_text)} characters from {file_path.name}")
+        
+        # Only non-blank parts are joined, so any text at all is real content
+        return full_text or None
+    
+    def iter_pages(self, file_path: Path) -> Iterator[str]:
+        """
+        Yield the text of each non-empty page of a PDF file.
+        
+        Pages are read one at a time, so callers that consume them
+        incrementally never hold the whole document's text.
+        
+        Args:
+            file_path: Path to the PDF file
             
-            full_text = "\n".join(text_parts)
-            logger.info(f"Successfully extracted {len(full_text)} characters from {file_path.name}")
+        Yields:
+            Text content of each page that has any
+        """
+        try:
+            logger.debug(f"Extracting text from PDF: {file_path.name}")
             
-            return full_text if full_text.strip() else None
+            with fitz.open(str(file_path)) as doc:
+                for page_num, page in enumerate(doc, 1):
+                    text = page.get_text("text")
+                    if text and not text.isspace():
+                        logger.opt(lazy=True).debug("Extracted {} chars from page {}", lambda: len(text), lambda: page_num)
+                        yield text
             
         except Exception as e:
             logger.error(f"Error extracting text from PDF {file_path.name}: {e}")
-            return None
     
     def extract_metadata(self, file_path: Path) -> dict:
         """
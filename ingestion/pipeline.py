@@ -0,0 +1,56 @@
+"""
+Ingestion Pipeline Module
+Extracts and chunks a single document; safe to run in a worker process.
+"""
+
+from pathlib import Path
+from typing import List, Dict
+from loguru import logger
+
+from .pdf_reader import PDFReader
+from .docx_reader import DOCXReader
+from .chunker import TextChunker
+
+
+def extract_and_chunk(doc_path_str: str, chunk_size: int = 512, overlap: int = 50) -> List[Dict]:
+    """
+    Extract text from a document and split it into chunks.
+    
+    Takes and returns only picklable values and builds its own readers and
+    chunker, so it can be mapped over a process pool.
+    
+    Args:
+        doc_path_str: Path to the document
+        chunk_size: Target size for each chunk (in characters)
+        overlap: Overlap between consecutive chunks (in characters)
+        
+    Returns:
+        List of chunk dictionaries (empty if no text could be extracted)
+    """
+    doc_path = Path(doc_path_str)
+    suffix = doc_path.suffix.lower()
+    
+    metadata = {
+        'file_name': doc_path.name,
+        'file_path': str(doc_path),
+        'file_type': doc_path.suffix[1:]
+    }
+    chunker = TextChunker(chunk_size=chunk_size, overlap=overlap)
+    
+    # Extract text based on file type; PDF pages are chunked as they are read
+    if suffix == '.pdf':
+        chunks = chunker.chunk_stream(PDFReader().iter_pages(doc_path), metadata)
+    elif suffix in ['.docx', '.doc']:
+        text = DOCXReader().extract_text(doc_path)
+        chunks = chunker.chunk_text(text, metadata) if text else []
+    elif suffix == '.txt':
+        text = doc_path.read_text(encoding='utf-8')
+        chunks = chunker.chunk_text(text, metadata) if text else []
+    else:
+        logger.warning(f"Unsupported format: {doc_path.suffix}")
+        return []
+    
+    if not chunks:
+        logger.warning(f"No text extracted from {doc_path.name}")
+    
+    return chunks
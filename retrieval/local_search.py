@@ -3,6 +3,7 @@ Local Search Module
 Handles semantic search within local document embeddings.
 """
 
+from collections import OrderedDict
 from typing import List, Dict, Tuple, Optional
 import numpy as np
 from loguru import logger
@@ -18,6 +19,9 @@ class LocalSearch:
     Primary source for retrieving relevant context.
     """
     
+    # Number of recent query embeddings kept for repeated autocomplete lookups
+    QUERY_CACHE_SIZE = 256
+    
     def __init__(self, embedder: Embedder, vector_store: VectorStore):
         """
         Initialize local search.
@@ -29,6 +33,11 @@ class LocalSearch:
         self.embedder = embedder
         self.vector_store = vector_store
         self.similarity_threshold = config.similarity_threshold
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        
+        # Most recent search, reused while the typed query has not advanced
+        self._last_key: Optional[Tuple[str, int, int]] = None
+        self._last_results: List[Dict] = []
         
         logger.info("Local search initialized")
     
@@ -48,44 +57,122 @@ class LocalSearch:
             return []
         
         try:
+            top_k = top_k or config.top_k_results
+            
+            # Same query, result count and index contents as last time: nothing to recompute
+            key = (' '.join(query.split()), top_k, len(self.vector_store.documents))
+            if key == self._last_key:
+                logger.debug("Reusing results of the previous search")
+                return list(self._last_results)
+            
             # Encode query
-            logger.debug(f"Searching for: {query[:100]}...")
-            query_embedding = self.embedder.encode_single(query)
+            logger.opt(lazy=True).debug("Searching for: {}...", lambda: query[:100])
+            query_embedding = self._encode_query(query)
             
             # Search vector store
-            top_k = top_k or config.top_k_results
-            results = self.vector_store.search(query_embedding, top_k)
-            
-            # Filter by similarity threshold and format results
-            filtered_results = []
-            for doc, score in results:
-                if score >= self.similarity_threshold:
-                    result = {
-                        'text': doc.get('text', ''),
-                        'source': 'local',
-                        'similarity_score': score,
-                        'metadata': {
-                            'file_name': doc.get('file_name', 'unknown'),
-                            'chunk_index': doc.get('chunk_index', 0),
-                            'file_path': doc.get('file_path', ''),
-                        }
-                    }
-                    filtered_results.append(result)
-                    
-                    logger.debug(
-                        f"Local result: {doc.get('file_name', 'unknown')} "
-                        f"(chunk {doc.get('chunk_index', 0)}) - Score: {score:.3f}"
-                    )
-                else:
-                    logger.debug(f"Filtered out result with score {score:.3f} (threshold: {self.similarity_threshold})")
-            
-            logger.info(f"Found {len(filtered_results)} local results above threshold")
+            results = self.vector_store.search(query_embedding, top_k, self.similarity_threshold)
+            
+            filtered_results = self._format_results(results)
+            self._last_key = key
+            self._last_results = list(filtered_results)
+            
+            logger.debug(f"Found {len(filtered_results)} local results above threshold")
             return filtered_results
             
         except Exception as e:
             logger.error(f"Error in local search: {e}")
             return []
     
+    def _encode_query(self, query: str) -> np.ndarray:
+        """
+        Encode a query, reusing the embedding of a recently seen equivalent query.
+        
+        Queries differing only in whitespace share a cache entry; the
+        tokenizer discards whitespace runs, so their embeddings are the same.
+        
+        Args:
+            query: Search query text
+            
+        Returns:
+            1D numpy array of the query embedding
+        """
+        key = ' '.join(query.split())
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return cached
+        
+        query_embedding = self.embedder.encode_single(key)
+        self._query_cache[key] = query_embedding
+        if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        
+        return query_embedding
+    
+    def clear_query_cache(self) -> None:
+        """Drop cached query embeddings and results, e.g. after the index is rebuilt."""
+        self._query_cache.clear()
+        self._last_key = None
+        self._last_results = []
+    
+    def search_batch(self, queries: List[str], top_k: Optional[int] = None) -> List[List[Dict]]:
+        """
+        Search for several queries with one encoder call and one index lookup.
+        
+        Args:
+            queries: Search query texts
+            top_k: Number of top results per query (uses config default if None)
+            
+        Returns:
+            One list of result dictionaries per query (empty for blank queries)
+        """
+        batch_results: List[List[Dict]] = [[] for _ in queries]
+        valid = [i for i, query in enumerate(queries) if query and query.strip()]
+        
+        if not valid:
+            return batch_results
+        
+        try:
+            query_embeddings = self.embedder.encode([queries[i] for i in valid])
+            
+            top_k = top_k or config.top_k_results
+            hits = self.vector_store.search_batch(query_embeddings, top_k, self.similarity_threshold)
+            
+            for i, results in zip(valid, hits):
+                batch_results[i] = self._format_results(results)
+            
+            logger.debug(f"Batch searched {len(valid)} queries")
+            
+        except Exception as e:
+            logger.error(f"Error in batch local search: {e}")
+        
+        return batch_results
+    
+    def _format_results(self, results: List[Tuple[Dict, float]]) -> List[Dict]:
+        """
+        Format vector store hits as result dictionaries.
+        
+        Args:
+            results: List of (document, similarity_score) tuples above the threshold
+            
+        Returns:
+            List of result dictionaries
+        """
+        return [
+            {
+                'text': doc.get('text', ''),
+                'source': 'local',
+                'similarity_score': score,
+                'metadata': {
+                    'file_name': doc.get('file_name', 'unknown'),
+                    'chunk_index': doc.get('chunk_index', 0),
+                    'file_path': doc.get('file_path', ''),
+                    'sources': doc.get('sources', []),
+                }
+            }
+            for doc, score in results
+        ]
+    
     def get_context(self, query: str, max_length: Optional[int] = None) -> str:
         """
         Get concatenated context from top search results.
@@ -130,5 +217,10 @@ class LocalSearch:
         Returns:
             True if relevant results exist, False otherwise
         """
+        # Any search returns at least the top hit when one clears the threshold
+        last = self._last_key
+        if last and last[0] == ' '.join(query.split()) and last[2] == len(self.vector_store.documents):
+            return len(self._last_results) > 0
+        
         results = self.search(query, top_k=1)
         return len(results) > 0
@@ -3,7 +3,10 @@ Online Search Module
 Handles fallback to online sources when local data is insufficient.
 """
 
+import json
 import pickle
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 import time
@@ -22,20 +25,24 @@ class OnlineSearch:
     Caches results to minimize API calls and improve performance.
     """
     
-    def __init__(self, cache_enabled: bool = True):
+    def __init__(self, cache_enabled: bool = True, cache_path: Optional[str] = None):
         """
         Initialize online search.
         
         Args:
             cache_enabled: Whether to cache search results
+            cache_path: Path to the SQLite cache database (uses config default if None)
         """
         self.cache_enabled = cache_enabled
-        self.cache_path = config.online_cache_path
-        self.cache: Dict[str, List[Dict]] = {}
+        self.cache_path = Path(cache_path or config.online_cache_path)
+        if self.cache_path.suffix == '.pkl':
+            # Configs from older versions still point at the pickle file
+            self.cache_path = self.cache_path.with_suffix('.db')
         self.max_results = config.online_max_results
+        self._conn: Optional[sqlite3.Connection] = None
         
         if self.cache_enabled:
-            self._load_cache()
+            self._open_cache()
         
         logger.info("Online search initialized")
     
@@ -54,9 +61,10 @@ class OnlineSearch:
             return []
         
         # Check cache first
-        if self.cache_enabled and query in self.cache:
+        cached = self._get_cached(query)
+        if cached is not None:
             logger.info(f"Returning cached online results for query: {query[:50]}...")
-            return self.cache[query]
+            return cached
         
         results = []
         
@@ -67,9 +75,8 @@ class OnlineSearch:
         # Could add more sources here (e.g., DuckDuckGo, specific docs sites)
         
         # Cache results
-        if self.cache_enabled and results:
-            self.cache[query] = results
-            self._save_cache()
+        if results:
+            self._put_cached(query, results)
         
         logger.info(f"Online search returned {len(results)} results")
         return results
@@ -90,87 +97,137 @@ class OnlineSearch:
             # Search for pages
             search_results = wikipedia.search(query, results=self.max_results)
             
-            results = []
-            for title in search_results[:self.max_results]:
-                try:
-                    # Get page summary
-                    page = wikipedia.page(title, auto_suggest=False)
-                    summary = page.summary
-                    
-                    result = {
-                        'text': summary,
-                        'source': 'wikipedia',
-                        'similarity_score': 0.0,  # Not computed for online results
-                        'metadata': {
-                            'title': title,
-                            'url': page.url,
-                            'timestamp': time.time()
-                        }
-                    }
-                    results.append(result)
-                    
-                    logger.debug(f"Retrieved Wikipedia article: {title}")
-                    
-                except wikipedia.exceptions.DisambiguationError as e:
-                    # Try first option from disambiguation
-                    if e.options:
-                        try:
-                            page = wikipedia.page(e.options[0], auto_suggest=False)
-                            summary = page.summary
-                            
-                            result = {
-                                'text': summary,
-                                'source': 'wikipedia',
-                                'similarity_score': 0.0,
-                                'metadata': {
-                                    'title': e.options[0],
-                                    'url': page.url,
-                                    'timestamp': time.time()
-                                }
-                            }
-                            results.append(result)
-                            
-                        except Exception:
-                            continue
-                            
-                except wikipedia.exceptions.PageError:
-                    logger.debug(f"Wikipedia page not found: {title}")
-                    continue
-                    
-                except Exception as e:
-                    logger.warning(f"Error fetching Wikipedia page '{title}': {e}")
-                    continue
+            titles = search_results[:self.max_results]
+            if not titles:
+                return []
             
-            return results
+            # Page fetches are independent HTTP round trips, so run them concurrently;
+            # map() keeps the results in Wikipedia's ranking order
+            with ThreadPoolExecutor(max_workers=len(titles)) as executor:
+                pages = list(executor.map(self._fetch_wikipedia_page, titles))
             
+            results = [result for result in pages if result is not None]
+            
+            return results
+        
         except Exception as e:
             logger.error(f"Error in Wikipedia search: {e}")
             return []
     
-    def _load_cache(self) -> None:
-        """Load cached search results from disk."""
+    def _fetch_wikipedia_page(self, title: str) -> Optional[Dict]:
+        """
+        Fetch a single Wikipedia page summary; runs in a worker thread.
+        
+        Args:
+            title: Page title from the search results
+            
+        Returns:
+            Result dictionary, or None if the page could not be fetched
+        """
         try:
-            if self.cache_path.exists():
-                with open(self.cache_path, 'rb') as f:
-                    self.cache = pickle.load(f)
-                logger.info(f"Loaded online search cache with {len(self.cache)} entries")
+            result = self._wikipedia_result(title)
+            logger.debug(f"Retrieved Wikipedia article: {title}")
+            return result
+        
+        except wikipedia.exceptions.DisambiguationError as e:
+            # Try first option from disambiguation
+            if e.options:
+                try:
+                    return self._wikipedia_result(e.options[0])
+                except Exception:
+                    pass
+            return None
+        
+        except wikipedia.exceptions.PageError:
+            logger.debug(f"Wikipedia page not found: {title}")
+            return None
+        
         except Exception as e:
-            logger.warning(f"Error loading online search cache: {e}")
-            self.cache = {}
+            logger.warning(f"Error fetching Wikipedia page '{title}': {e}")
+            return None
     
-    def _save_cache(self) -> None:
-        """Save cached search results to disk."""
+    @staticmethod
+    def _wikipedia_result(title: str) -> Dict:
+        """Build a result dictionary from a Wikipedia page summary."""
+        page = wikipedia.page(title, auto_suggest=False)
+        
+        return {
+            'text': page.summary,
+            'source': 'wikipedia',
+            'similarity_score': 0.0,  # Not computed for online results
+            'metadata': {
+                'title': title,
+                'url': page.url,
+                'timestamp': time.time()
+            }
+        }
+    
+    def _open_cache(self) -> None:
+        """Open the SQLite result cache, importing a legacy pickle cache once."""
         try:
             self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_path, 'wb') as f:
-                pickle.dump(self.cache, f)
+            self._conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (query TEXT PRIMARY KEY, results TEXT NOT NULL)"
+            )
+            self._conn.commit()
+            self._migrate_legacy_cache()
+        except Exception as e:
+            logger.warning(f"Error opening online search cache: {e}")
+            self._conn = None
+    
+    def _migrate_legacy_cache(self) -> None:
+        """Import the pickled dict written by older versions, then set it aside."""
+        legacy_path = self.cache_path.with_suffix('.pkl')
+        if not legacy_path.exists():
+            return
+        
+        try:
+            with open(legacy_path, 'rb') as f:
+                legacy = pickle.load(f)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO cache (query, results) VALUES (?, ?)",
+                [(query, json.dumps(results)) for query, results in legacy.items()]
+            )
+            self._conn.commit()
+            legacy_path.replace(legacy_path.with_suffix('.pkl.migrated'))
+            logger.info(f"Imported {len(legacy)} entries from legacy online search cache")
+        except Exception as e:
+            logger.warning(f"Error importing legacy online search cache: {e}")
+    
+    def _get_cached(self, query: str) -> Optional[List[Dict]]:
+        """Look up cached results for a query."""
+        if self._conn is None:
+            return None
+        
+        try:
+            row = self._conn.execute(
+                "SELECT results FROM cache WHERE query = ?", (query,)
+            ).fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            logger.warning(f"Error reading online search cache: {e}")
+            return None
+    
+    def _put_cached(self, query: str, results: List[Dict]) -> None:
+        """Store the results for a query; writes only the new entry."""
+        if self._conn is None:
+            return
+        
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (query, results) VALUES (?, ?)",
+                (query, json.dumps(results))
+            )
+            self._conn.commit()
             logger.debug("Online search cache saved")
         except Exception as e:
             logger.error(f"Error saving online search cache: {e}")
     
     def clear_cache(self) -> None:
         """Clear the online search cache."""
-        self.cache = {}
-        if self.cache_path.exists():
-            self.cache_path.unlink()
+        if self._conn is not None:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
         logger.info("Online search cache cleared")
@@ -33,11 +33,13 @@ class Ranker:
             Merged and ranked list of results
         """
         ranked = []
+        seen_texts = set()
         
         # Add all local results first (they're already filtered and scored)
         if local_results:
-            ranked.extend(local_results)
-            logger.info(f"Added {len(local_results)} local results to ranking")
+            unique_local = self._unique(local_results, seen_texts)
+            ranked.extend(unique_local)
+            logger.info(f"Added {len(unique_local)} local results to ranking")
         
         # Only add online results if local results are insufficient
         if online_results:
@@ -45,11 +47,36 @@ class Ranker:
             for result in online_results:
                 result['is_fallback'] = True
             
-            ranked.extend(online_results)
-            logger.info(f"Added {len(online_results)} online results as fallback")
+            unique_online = self._unique(online_results, seen_texts)
+            ranked.extend(unique_online)
+            logger.info(f"Added {len(unique_online)} online results as fallback")
+        
+        dropped = len(local_results or []) + len(online_results or []) - len(ranked)
+        if dropped:
+            logger.debug(f"Dropped {dropped} duplicate results")
         
         return ranked
     
+    @staticmethod
+    def _unique(results: List[Dict], seen_texts: set) -> List[Dict]:
+        """
+        Keep the first result for each distinct text.
+        
+        Args:
+            results: Results in priority order
+            seen_texts: Texts already ranked; updated in place
+            
+        Returns:
+            Results whose text has not been seen before
+        """
+        unique = []
+        for result in results:
+            text = result.get('text', '')
+            if text not in seen_texts:
+                seen_texts.add(text)
+                unique.append(result)
+        return unique
+    
     def get_best_context(self, results: List[Dict], max_length: int = None) -> str:
         """
         Extract the best context from ranked results.
@@ -65,37 +92,30 @@ class Ranker:
         
         context_parts = []
         current_length = 0
-        local_count = 0
-        online_count = 0
         
         for result in results:
             text = result.get('text', '')
-            source = result.get('source', 'unknown')
             
             if current_length + len(text) <= max_length:
                 context_parts.append(text)
                 current_length += len(text)
-                
-                if source == 'local':
-                    local_count += 1
-                else:
-                    online_count += 1
             else:
                 # Add partial text if meaningful space remains
                 remaining = max_length - current_length
                 if remaining > 100:
                     context_parts.append(text[:remaining])
-                    if source == 'local':
-                        local_count += 1
-                    else:
-                        online_count += 1
                 break
         
         context = "\n\n---\n\n".join(context_parts)
         
-        logger.debug(
-            f"Generated context: {len(context)} chars "
-            f"({local_count} local, {online_count} online)"
+        # Context parts map 1:1 onto a prefix of the results; sources are only
+        # counted if the debug message is actually emitted
+        n_used = len(context_parts)
+        logger.opt(lazy=True).debug(
+            "Generated context: {} chars ({} local, {} online)",
+            lambda: len(context),
+            lambda: sum(1 for r in results[:n_used] if r.get('source', 'unknown') == 'local'),
+            lambda: sum(1 for r in results[:n_used] if r.get('source', 'unknown') != 'local')
         )
         
         return context
@@ -109,10 +109,28 @@ class AITextGenerator:
             if not self.load_model():
                 return ""
         
-        try:
-            # Build prompt with retrieved context (RAG)
-            full_prompt = self._build_rag_prompt(prompt, context)
+        # Build prompt with retrieved context (RAG)
+        full_prompt = self._build_rag_prompt(prompt, context)
+        return self._complete(full_prompt, max_tokens, temperature)
+    
+    def _complete(
+        self,
+        full_prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> str:
+        """
+        Run the loaded model on an already built prompt.
+        
+        Args:
+            full_prompt: Complete prompt text
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0-1.0)
             
+        Returns:
+            Generated text
+        """
+        try:
             # Generate completion
             response = self.llm(
                 full_prompt,
@@ -189,17 +207,20 @@ Natural continuation:"""
         Returns:
             List of generated texts
         """
+        if not self._is_loaded:
+            if not self.load_model():
+                return []
+        
         suggestions = []
         temperatures = [0.5, 0.7, 0.9]  # Varying creativity
         
+        # Build the prompt once; llama.cpp reuses the evaluated prefix of a repeated prompt
+        full_prompt = self._build_rag_prompt(prompt, context)
+        
         for i in range(count):
             temp = temperatures[i % len(temperatures)]
             
-            suggestion = self.generate(
-                prompt,
-                context=context,
-                temperature=temp
-            )
+            suggestion = self._complete(full_prompt, temperature=temp)
             
             if suggestion and suggestion not in suggestions:
                 suggestions.append(suggestion)
@@ -209,6 +230,10 @@ Natural continuation:"""
     def is_available(self) -> bool:
         """Check if AI generation is available."""
         return LLAMA_AVAILABLE and (self._is_loaded or self.model_path.exists())
+    
+    def is_loaded(self) -> bool:
+        """Check if the model is loaded."""
+        return self._is_loaded
 
 
 # Global instance
@@ -111,6 +111,7 @@ Autocomplete Module
 AI model just makes it even smarter! 🚀- Shows contextual suggestions- Retrieves relevant text from your documents- Uses intelligent template matchingThe system still works great without downloading a model!### Without AI Model- Close other applications- Use Q4_K_M quantization (smaller)**Out of memory**- Reduce max_tokens in config- Use a smaller model (TinyLlama)**Slow suggestions**- Ensure .gguf file is in models/ folder- Check file path in config.yaml**Error: "Model not found"**### Troubleshooting- **Temperature 0.9** = Creative, diverse- **Temperature 0.5** = Conservative, predictable- **Larger model** = Better quality, slower- **Smaller model** = Faster response, less accurate### Performance Tips4. Watch AI-powered suggestions appear!3. Start typing in any application2. Build the index1. Load your documentsThen:```python app.py```powershellAfter setup, run:### Testing✅ **Fallback**: Works without model (template-based mode)  ✅ **Smart**: Understands context and generates natural text  ✅ **Private**: No data sent to cloud  ✅ **Fast**: Runs locally on CPU  ✅ **Context-Aware**: Uses your documents for relevant suggestions  ### Features4. **You see**: Intelligent, contextual suggestion!3. **AI generates**: "artificial intelligence that enables computers to learn and improve from experience without being explicitly programmed."2. **System retrieves**: Relevant content from your documents (RAG)1. **You type**: "Machine learning is a branch of"### How It Works```  top_p: 0.9  top_k: 40  max_tokens: 100   # Response length  temperature: 0.7  # Creativity (0.0-1.0)  model_path: "./models/YOUR_MODEL_NAME.gguf"llm:```yaml4. **Update config.yaml**:```D:\Workspace\AITextAssistant\models\# Copy the downloaded .gguf file to:```powershell3. **Place the model file**:```# Download: mistral-7b-instruct-v0.2.Q4_K_M.gguf# Visit: https://huggingface.co/TheBloke/Mistral-7B-Instruct-v0.2-GGUF/tree/main# Download Mistral 7B - highest quality```powershell#### Option C: Best Quality (~4GB)```# Download: Phi-3-mini-4k-instruct-q4.gguf# Visit: https://huggingface.co/microsoft/Phi-3-mini-4k-instruct-gguf/tree/main# Download Phi-3 Mini - excellent quality```powershell#### Option B: Recommended Model (Balanced, ~2GB)```# Download: TinyLlama-1.1B-Chat-v1.0.Q4_K_M.gguf# Visit: https://huggingface.co/TheBloke/TinyLlama-1.1B-Chat-v1.0-GGUF/tree/main# Download TinyLlama - great for quick responses```powershell#### Option A: Tiny Model (Fast, ~700MB)2. **Download a model** (choose one):```pip install llama-cpp-python```powershell1. **Install the AI library**:### Quick SetupYour AI Text Assistant can now generate intelligent text completions using a local AI model!## 🤖 Enable AI Text GenerationProvides real-time text suggestions based on context with AI generation.
 """
 
+import re
 from typing import List, Optional
 from loguru import logger
 
@@ -121,6 +122,10 @@ from suggestion.ai_generator import AITextGenerator
 from config.settings import config
 
 
+# Sentence boundaries used to find the start of the last sentence
+_SENTENCE_BOUNDARY_RE = re.compile(r'[.!?] |\n')
+
+
 class Autocomplete:
     """
     Generates intelligent text suggestions based on user input.
@@ -159,6 +164,26 @@ class Autocomplete:
         
         logger.info("Autocomplete engine initialized with AI generation")
     
+    def preload(self) -> bool:
+        """
+        Load the AI generator model up front so the first request does not pay for it.
+        
+        Returns:
+            True if the generator model is loaded, False otherwise
+        """
+        generator = self.ai_generator
+        if generator is None or not generator.is_available():
+            return False
+        
+        try:
+            if not generator.is_loaded():
+                logger.info("Preloading AI generator model...")
+                generator.load_model()
+            return generator.is_loaded()
+        except Exception as e:
+            logger.warning(f"AI generator preload failed: {e}")
+            return False
+    
     def get_suggestions(self, context: str, num_suggestions: int = 3) -> List[str]:
         """
         Generate text suggestions based on current context.
@@ -185,6 +210,9 @@ class Autocomplete:
             
             suggestions = []
             
+            # Lowercased once for the repeated-content check on every result
+            context_lower = context.lower()
+            
             # Try AI generation first if available
             if self.ai_generator and self.ai_generator.is_available():
                 logger.info("Using AI generation for suggestions")
@@ -211,7 +239,7 @@ class Autocomplete:
                     if len(suggestions) >= num_suggestions:
                         break
                     
-                    suggestion = self._generate_suggestion_from_result(result, context)
+                    suggestion = self._generate_suggestion_from_result(result, context_lower)
                     if suggestion and suggestion not in suggestions:
                         suggestions.append(suggestion)
             
@@ -223,7 +251,7 @@ class Autocomplete:
                 
                 if online_results:
                     for result in online_results[:num_suggestions - len(suggestions)]:
-                        suggestion = self._generate_suggestion_from_result(result, context)
+                        suggestion = self._generate_suggestion_from_result(result, context_lower)
                         if suggestion and suggestion not in suggestions:
                             suggestions.append(suggestion)
             
@@ -247,23 +275,23 @@ class Autocomplete:
         # Take last N characters as query context
         query = context[-self.context_window:].strip()
         
-        # Try to find last complete sentence
-        for delimiter in ['. ', '! ', '? ', '\n']:
-            if delimiter in query:
-                parts = query.split(delimiter)
-                if parts[-1].strip():
-                    query = parts[-1].strip()
-                    break
+        # Keep the text after the last sentence boundary, found in one scan
+        match = None
+        for match in _SENTENCE_BOUNDARY_RE.finditer(query):
+            pass
+        
+        if match:
+            query = query[match.end():].strip()
         
         return query
     
-    def _generate_suggestion_from_result(self, result: dict, context: str) -> Optional[str]:
+    def _generate_suggestion_from_result(self, result: dict, context_lower: str) -> Optional[str]:
         """
         Generate a suggestion from a search result.
         
         Args:
             result: Search result dictionary
-            context: Current context
+            context_lower: Current context, lowercased
             
         Returns:
             Suggested text or None
@@ -273,8 +301,8 @@ class Autocomplete:
             if not text:
                 return None
             
-            # Extract more content - show multiple sentences or full paragraph
-            sentences = text.split('. ')
+            # Extract more content - only the first 3 sentences are used, so stop splitting there
+            sentences = text.split('. ', 3)
             
             if sentences:
                 # Take first 2-3 sentences for richer context
@@ -296,7 +324,8 @@ class Autocomplete:
                     suggestion = suggestion[:max_length].rsplit('. ', 1)[0] + '.'
                 
                 # Don't suggest if it's too similar to existing context
-                if suggestion.lower() not in context.lower():
+                # (lowercasing never shortens text, so a longer suggestion cannot be contained)
+                if len(suggestion) > len(context_lower) or suggestion.lower() not in context_lower:
                     # Add metadata for context
                     metadata = result.get('metadata', {})
                     source_file = metadata.get('file_name', '')
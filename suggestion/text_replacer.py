@@ -184,12 +184,10 @@ class TextReplacer:
         if not result_text:
             return None
         
-        # Extract most relevant sentence
-        sentences = [s.strip() for s in result_text.split('. ') if s.strip()]
+        # Return first sentence as refinement (could be more sophisticated)
+        refined = self._first_sentence(result_text)
         
-        if sentences:
-            # Return first sentence as refinement (could be more sophisticated)
-            refined = sentences[0]
+        if refined:
             if not refined.endswith('.'):
                 refined += '.'
             return refined
@@ -214,9 +212,9 @@ class TextReplacer:
             text = result.get('text', '')
             if text:
                 # Extract first sentence
-                sentences = [s.strip() for s in text.split('. ') if s.strip()]
-                if sentences and sentences[0] not in expansion_parts:
-                    expansion_parts.append(sentences[0])
+                sentence = self._first_sentence(text)
+                if sentence and sentence not in expansion_parts:
+                    expansion_parts.append(sentence)
         
         if len(expansion_parts) > 1:
             expanded = '. '.join(expansion_parts)
@@ -226,13 +224,19 @@ class TextReplacer:
         
         return None
     
+    @staticmethod
+    def _first_sentence(text: str) -> Optional[str]:
+        """Get the first non-empty sentence of text without stripping the rest."""
+        return next((s.strip() for s in text.split('. ') if s.strip()), None)
+    
     def _extract_alternative(self, text: str, original: str) -> Optional[str]:
         """Extract alternative phrasing from text."""
         # Simple approach: return first sentence if different from original
         sentences = [s.strip() for s in text.split('. ') if s.strip()]
+        original_lower = original.lower()
         
         for sentence in sentences:
-            if sentence.lower() != original.lower() and len(sentence) > 10:
+            if len(sentence) > 10 and sentence.lower() != original_lower:
                 if not sentence.endswith('.'):
                     sentence += '.'
                 return sentence
@@ -2,11 +2,17 @@
 Unit Tests for Embeddings and Vector Store
 """
 
+import os
 import pytest
 import numpy as np
+import torch
+import faiss
 
+from config.settings import config
+from embeddings import vector_store as vector_store_module
 from embeddings.embedder import Embedder
 from embeddings.vector_store import VectorStore
+from embeddings.embedding_cache import EmbeddingCache
 
 
 class TestEmbedder:
@@ -44,6 +50,42 @@ class TestEmbedder:
         assert isinstance(embeddings, np.ndarray)
         assert len(embeddings) == 3
         assert embeddings.shape[1] == embedder.embedding_dimension
+    
+    def test_cache_key_includes_precision(self):
+        """Test FP32 and INT8 models do not share embedding cache entries."""
+        fp32 = Embedder(device="cpu")
+        fp32.quantize = False
+        fp32.backend = "torch"
+        int8 = Embedder(device="cpu")
+        int8.quantize = True
+        int8.backend = "torch"
+        
+        assert fp32.cache_key == f"{fp32.model_name}|torch|fp32"
+        assert int8.cache_key == f"{int8.model_name}|torch|int8"
+    
+    def test_failed_int8_probe_restores_fp32(self):
+        """Test a failing INT8 probe leaves the FP32 module installed and keyed as fp32."""
+        class Transformer:
+            auto_model = torch.nn.Sequential(torch.nn.Linear(8, 8))
+        
+        class FailingModel:
+            def __init__(self):
+                self.transformer = Transformer()
+            
+            def __getitem__(self, i):
+                return self.transformer
+            
+            def encode(self, texts, **kwargs):
+                raise RuntimeError("probe failed")
+        
+        embedder = Embedder(device="cpu")
+        embedder.model = FailingModel()
+        fp32_model = embedder.model[0].auto_model
+        
+        embedder._quantize_int8()
+        
+        assert embedder.model[0].auto_model is fp32_model
+        assert embedder.cache_key.endswith("|torch|fp32")
 
 
 class TestVectorStore:
@@ -85,6 +127,30 @@ class TestVectorStore:
         assert len(results) > 0
         assert len(results) <= 3
     
+    def test_search_batch(self, vector_store):
+        """Test batched search returns one result list per query."""
+        vector_store.create_index()
+        embeddings = np.random.rand(5, 384).astype(np.float32)
+        vector_store.add_documents(embeddings, [{'text': f'Doc {i}'} for i in range(5)])
+        
+        batch = vector_store.search_batch(embeddings[[3, 1]], top_k=2)
+        
+        assert len(batch) == 2
+        assert batch[0][0][0]['text'] == 'Doc 3'
+        assert batch[1][0][0]['text'] == 'Doc 1'
+        assert vector_store.search(embeddings[3], top_k=2) == batch[0]
+    
+    def test_search_min_score(self, vector_store):
+        """Test results below min_score are dropped by the vector store."""
+        vector_store.create_index()
+        embeddings = np.eye(3, 384, dtype=np.float32)
+        vector_store.add_documents(embeddings, [{'text': f'Doc {i}'} for i in range(3)])
+        
+        results = vector_store.search(embeddings[1], top_k=3, min_score=0.5)
+        
+        assert [doc['text'] for doc, _ in results] == ['Doc 1']
+        assert len(vector_store.search(embeddings[1], top_k=3)) == 3
+    
     def test_save_and_load(self, vector_store):
         """Test saving and loading index."""
         vector_store.create_index()
@@ -106,6 +172,206 @@ class TestVectorStore:
         
         assert success
         assert len(new_store.documents) == 3
+    
+    def test_append_after_load(self, vector_store):
+        """Test adding to a memory-mapped index loaded from disk."""
+        vector_store.create_index()
+        embeddings = np.random.rand(3, 384).astype(np.float32)
+        vector_store.add_documents(embeddings, [{'text': f'Doc {i}'} for i in range(3)])
+        vector_store.save()
+        
+        new_store = VectorStore(index_path=str(vector_store.index_path), dimension=384)
+        assert new_store.load()
+        
+        extra = np.random.rand(1, 384).astype(np.float32)
+        new_store.add_documents(extra, [{'text': 'Extra'}])
+        new_store.save()
+        
+        assert new_store.search(extra[0], top_k=1)[0][0]['text'] == 'Extra'
+        assert new_store.index.ntotal == 4
+    
+    @pytest.mark.skipif(not os.path.exists('/proc/self/maps'), reason="needs /proc/self/maps")
+    def test_load_memory_maps_index(self, vector_store):
+        """Test the loaded scalar-quantized index is memory-mapped rather than read into RAM."""
+        vector_store.create_index()
+        embeddings = np.random.rand(3, 384).astype(np.float32)
+        vector_store.add_documents(embeddings, [{'text': f'Doc {i}'} for i in range(3)])
+        vector_store.save()
+        
+        new_store = VectorStore(index_path=str(vector_store.index_path), dimension=384)
+        assert new_store.load()
+        
+        index_file = os.path.realpath(new_store._index_files()['flat'])
+        with open('/proc/self/maps') as f:
+            assert index_file in f.read()
+        assert new_store._is_mmapped
+        assert new_store.search(embeddings[1], top_k=1)[0][0]['text'] == 'Doc 1'
+    
+    def test_docs_log_append_only(self, vector_store):
+        """Test saving appends only new documents to the metadata log."""
+        vector_store.create_index()
+        embeddings = np.random.rand(3, 384).astype(np.float32)
+        vector_store.add_documents(embeddings, [{'text': f'Doc {i}'} for i in range(3)])
+        vector_store.save()
+        
+        log_path = vector_store._docs_files()[vector_store._log_format()]
+        with open(log_path, 'rb') as f:
+            first_save = f.read()
+        
+        extra = np.random.rand(2, 384).astype(np.float32)
+        vector_store.add_documents(extra, [{'text': f'Extra {i}'} for i in range(2)])
+        vector_store.save()
+        
+        with open(log_path, 'rb') as f:
+            second_save = f.read()
+        
+        assert second_save.startswith(first_save)
+        
+        new_store = VectorStore(index_path=str(vector_store.index_path), dimension=384)
+        assert new_store.load()
+        assert [doc['text'] for doc in new_store.documents][-2:] == ['Extra 0', 'Extra 1']
+    
+    def test_add_sources_persisted(self, vector_store):
+        """Test duplicate sources survive saves before and after the document is logged."""
+        vector_store.create_index()
+        embeddings = np.random.rand(2, 384).astype(np.float32)
+        vector_store.add_documents(embeddings, [{'text': f'Doc {i}'} for i in range(2)])
+        vector_store.add_sources(0, [{'file_name': 'a.txt'}])
+        vector_store.save()
+        
+        vector_store.add_sources(0, [{'file_name': 'b.txt'}])
+        vector_store.save()
+        
+        new_store = VectorStore(index_path=str(vector_store.index_path), dimension=384)
+        assert new_store.load()
+        assert len(new_store.documents) == 2
+        assert new_store.documents[0]['sources'] == [{'file_name': 'a.txt'}, {'file_name': 'b.txt'}]
+    
+    def test_tiered_index(self, vector_store):
+        """Test hot/cold tiered index search and persistence."""
+        vector_store.tiered_threshold = 100
+        vector_store.create_index(expected_size=2000)
+        assert vector_store.is_tiered
+        
+        # Bulk build trains and fills the cold tier
+        embeddings = np.random.rand(2000, 384).astype(np.float32)
+        documents = [{'text': f'Doc {i}'} for i in range(2000)]
+        vector_store.add_documents(embeddings, documents)
+        
+        # Later additions land in the hot tier
+        extra = np.random.rand(5, 384).astype(np.float32)
+        vector_store.add_documents(extra, [{'text': f'Extra {i}'} for i in range(5)])
+        
+        stats = vector_store.get_stats()
+        assert stats['cold_documents'] == 2000
+        assert stats['hot_documents'] == 5
+        
+        results = vector_store.search(extra[0], top_k=3)
+        assert results[0][0]['text'] == 'Extra 0'
+        
+        vector_store.save()
+        new_store = VectorStore(index_path=str(vector_store.index_path), dimension=384)
+        assert new_store.load()
+        assert new_store.is_tiered
+        assert new_store.search(extra[0], top_k=1)[0][0]['text'] == 'Extra 0'
+    
+    def test_incremental_promotion(self, vector_store):
+        """Test a flat index built incrementally is promoted and compacted."""
+        vector_store.tiered_threshold = 300
+        vector_store.HOT_TIER_CAPACITY = 100
+        vector_store.create_index()
+        
+        # Crossing the threshold switches to the tiered layout
+        for batch in range(8):
+            embeddings = np.random.rand(50, 384).astype(np.float32)
+            vector_store.add_documents(embeddings, [{'text': f'Doc {batch}-{i}'} for i in range(50)])
+        assert vector_store.is_tiered
+        assert vector_store.get_stats()['cold_documents'] == 350
+        
+        # A full hot tier is folded into the cold tier
+        for batch in range(8, 10):
+            embeddings = np.random.rand(50, 384).astype(np.float32)
+            vector_store.add_documents(embeddings, [{'text': f'Doc {batch}-{i}'} for i in range(50)])
+        
+        stats = vector_store.get_stats()
+        assert stats['cold_documents'] == 450
+        assert stats['hot_documents'] == 50
+        assert vector_store.search(embeddings[0], top_k=1)[0][0]['text'] == 'Doc 9-0'
+    
+    def test_promotion_waits_for_enough_training_vectors(self, vector_store):
+        """Test a low threshold keeps the flat index until the cold tier can be trained."""
+        vector_store.tiered_threshold = 100
+        vector_store.create_index()
+        
+        embeddings = np.random.rand(150, 384).astype(np.float32)
+        vector_store.add_documents(embeddings, [{'text': f'Doc {i}'} for i in range(150)])
+        
+        assert not vector_store.is_tiered
+        assert vector_store.index.ntotal == 150
+        assert vector_store.search(embeddings[7], top_k=1)[0][0]['text'] == 'Doc 7'
+        
+        extra = np.random.rand(150, 384).astype(np.float32)
+        vector_store.add_documents(extra, [{'text': f'Extra {i}'} for i in range(150)])
+        
+        assert vector_store.is_tiered
+        assert vector_store.get_stats()['cold_documents'] == 300
+    
+    def test_configured_faiss_threads(self, monkeypatch):
+        """Test performance.num_threads sizes the FAISS pool and 0 falls back to half the CPUs."""
+        monkeypatch.setattr(vector_store_module, '_faiss_configured', False)
+        monkeypatch.setattr(config, 'performance_num_threads', 3)
+        vector_store_module._configure_faiss()
+        assert faiss.omp_get_max_threads() == 3
+        
+        monkeypatch.setattr(vector_store_module, '_faiss_configured', False)
+        monkeypatch.setattr(config, 'performance_num_threads', 0)
+        vector_store_module._configure_faiss()
+        assert faiss.omp_get_max_threads() == max(1, (os.cpu_count() or 1) // 2)
+    
+    def test_assume_normalized(self, tmp_path):
+        """Test pre-normalized vectors are stored unchanged and raw ones still normalized."""
+        store = VectorStore(index_path=str(tmp_path / "norm_index"), dimension=384, assume_normalized=True)
+        store.create_index()
+        
+        embeddings = np.random.rand(4, 384).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        original = embeddings.copy()
+        store.add_documents(embeddings, [{'text': f'Doc {i}'} for i in range(4)])
+        assert np.array_equal(embeddings, original)
+        
+        raw = np.random.rand(1, 384).astype(np.float32) * 5
+        store.add_documents(raw, [{'text': 'Raw'}])
+        assert np.isclose(np.linalg.norm(raw[0]), 1.0, atol=1e-3)
+        assert store.search(raw[0], top_k=1)[0][0]['text'] == 'Raw'
+
+
+class TestEmbeddingCache:
+    """Test embedding cache functionality."""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create embedding cache instance for testing."""
+        cache = EmbeddingCache(cache_path=str(tmp_path / "cache.db"))
+        yield cache
+        cache.close()
+    
+    def test_put_and_get(self, cache):
+        """Test storing and retrieving embeddings."""
+        key = EmbeddingCache.hash_text("Some chunk text")
+        vec = np.random.rand(384).astype(np.float32)
+        cache.put_many([(key, vec)], model="test-model")
+        
+        cached = cache.get_many([key, "missing"], model="test-model")
+        
+        assert list(cached) == [key]
+        assert np.array_equal(cached[key], vec)
+    
+    def test_keyed_by_model(self, cache):
+        """Test embeddings from another model are not returned."""
+        key = EmbeddingCache.hash_text("Some chunk text")
+        cache.put_many([(key, np.ones(384, dtype=np.float32))], model="model-a")
+        
+        assert cache.get_many([key], model="model-b") == {}
 
 
 if __name__ == "__main__":
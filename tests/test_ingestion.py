@@ -9,6 +9,7 @@ import tempfile
 from ingestion.pdf_reader import PDFReader
 from ingestion.docx_reader import DOCXReader
 from ingestion.chunker import TextChunker
+from ingestion.pipeline import extract_and_chunk
 
 
 class TestPDFReader:
@@ -71,6 +72,41 @@ class TestTextChunker:
         chunks = chunker.chunk_text("")
         
         assert len(chunks) == 0
+    
+    def test_chunk_stream_matches_chunk_text(self):
+        """Test streamed pieces chunk the same as the joined text."""
+        chunker = TextChunker(chunk_size=80, overlap=10)
+        pages = [
+            "Intro paragraph.\n\nA paragraph that continues",
+            "onto the next page. More text follows here.  \n",
+            " \nAfter a break split across pages. " * 5,
+        ]
+        
+        streamed = chunker.chunk_stream(pages, {'file_name': 'doc.pdf'})
+        
+        assert streamed == chunker.chunk_text("\n".join(pages), {'file_name': 'doc.pdf'})
+
+
+class TestExtractAndChunk:
+    """Test single-document extraction pipeline."""
+    
+    def test_text_file(self, tmp_path):
+        """Test extracting and chunking a text file."""
+        doc = tmp_path / "notes.txt"
+        doc.write_text("First sentence here. Second sentence here. " * 20, encoding='utf-8')
+        
+        chunks = extract_and_chunk(str(doc), chunk_size=100, overlap=10)
+        
+        assert len(chunks) > 1
+        assert chunks[0]['file_name'] == 'notes.txt'
+        assert chunks[0]['file_type'] == 'txt'
+    
+    def test_unsupported_format(self, tmp_path):
+        """Test unsupported files produce no chunks."""
+        doc = tmp_path / "image.png"
+        doc.write_bytes(b"not a document")
+        
+        assert extract_and_chunk(str(doc)) == []
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 Unit Tests for Retrieval System
 """
 
+import pickle
 import pytest
 import numpy as np
 
@@ -49,6 +50,52 @@ class TestLocalSearch:
         assert isinstance(results, list)
         # Results may be empty if below threshold
     
+    def test_search_batch(self, local_search):
+        """Test batched searching keeps one result list per query."""
+        results = local_search.search_batch(["programming", "", "statistics"], top_k=2)
+        
+        assert len(results) == 3
+        assert results[1] == []
+    
+    def test_query_cache(self, local_search):
+        """Test repeated queries reuse the cached embedding."""
+        first = local_search._encode_query("programming")
+        assert local_search._encode_query("programming") is first
+        assert local_search._encode_query("  machine\n learning ") is local_search._encode_query("machine learning")
+        
+        local_search.clear_query_cache()
+        assert local_search._encode_query("programming") is not first
+    
+    def test_repeated_search_reuses_results(self, local_search, monkeypatch):
+        """Test a query that has not advanced is answered without searching again."""
+        store = local_search.vector_store
+        calls = []
+        original_search = store.search
+        
+        def counting_search(*args, **kwargs):
+            calls.append(args)
+            return original_search(*args, **kwargs)
+        
+        monkeypatch.setattr(store, "search", counting_search)
+        first = local_search.search("programming", top_k=2)
+        assert local_search.search("programming ", top_k=2) == first
+        assert len(calls) == 1
+        
+        # Adding documents invalidates the reused results
+        store.add_documents(np.random.rand(1, store.dimension).astype(np.float32), [{'text': 'New'}])
+        local_search.search("programming", top_k=2)
+        assert len(calls) == 2
+    
+    def test_has_relevant_results_reuses_last_search(self, local_search, monkeypatch):
+        """Test the existence check answers from the previous search of the same query."""
+        found = len(local_search.search("programming")) > 0
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("vector store searched again")
+        
+        monkeypatch.setattr(local_search.vector_store, "search", fail)
+        assert local_search.has_relevant_results("programming") == found
+    
     def test_get_context(self, local_search):
         """Test context retrieval."""
         context = local_search.get_context("Python programming")
@@ -71,6 +118,36 @@ class TestOnlineSearch:
         
         assert isinstance(results, list)
         # May be empty if Wikipedia is unreachable
+    
+    def test_cache_persisted(self, tmp_path):
+        """Test cached results survive reopening and legacy pickles are imported."""
+        cache_path = tmp_path / "online_cache.db"
+        results = [{'text': 'Cached', 'source': 'wikipedia', 'similarity_score': 0.0}]
+        
+        with open(cache_path.with_suffix('.pkl'), 'wb') as f:
+            pickle.dump({'legacy query': results}, f)
+        
+        online_search = OnlineSearch(cache_enabled=True, cache_path=str(cache_path))
+        online_search._put_cached('new query', results)
+        
+        reopened = OnlineSearch(cache_enabled=True, cache_path=str(cache_path))
+        assert reopened.search('new query') == results
+        assert reopened.search('legacy query') == results
+        assert not cache_path.with_suffix('.pkl').exists()
+        assert cache_path.with_suffix('.pkl.migrated').exists()
+    
+    def test_legacy_cache_path_config(self, tmp_path):
+        """Test a configured pickle cache path is migrated into a sibling SQLite database."""
+        legacy_path = tmp_path / "online_cache.pkl"
+        results = [{'text': 'Cached', 'source': 'wikipedia', 'similarity_score': 0.0}]
+        
+        with open(legacy_path, 'wb') as f:
+            pickle.dump({'legacy query': results}, f)
+        
+        online_search = OnlineSearch(cache_enabled=True, cache_path=str(legacy_path))
+        
+        assert online_search.cache_path == tmp_path / "online_cache.db"
+        assert online_search.search('legacy query') == results
 
 
 class TestRanker:
@@ -91,6 +168,24 @@ class TestRanker:
         
         assert len(ranked) == 2
         assert ranked[0]['source'] == 'local'  # Local should be first
+    
+    def test_rank_results_deduplicates(self):
+        """Test repeated texts are ranked once, keeping the local copy."""
+        ranker = Ranker()
+        
+        local_results = [
+            {'text': 'Shared text', 'source': 'local', 'similarity_score': 0.9},
+            {'text': 'Shared text', 'source': 'local', 'similarity_score': 0.8}
+        ]
+        online_results = [
+            {'text': 'Shared text', 'source': 'wikipedia', 'similarity_score': 0.0},
+            {'text': 'Online only', 'source': 'wikipedia', 'similarity_score': 0.0}
+        ]
+        
+        ranked = ranker.rank_results(local_results, online_results)
+        
+        assert [r['text'] for r in ranked] == ['Shared text', 'Online only']
+        assert ranked[0]['similarity_score'] == 0.9
 
 
 if __name__ == "__main__":
@@ -0,0 +1,118 @@
+"""
+Unit Tests for Suggestion Engines
+"""
+
+import pytest
+
+from suggestion.autocomplete import Autocomplete
+from suggestion.text_replacer import TextReplacer
+from suggestion.ai_generator import AITextGenerator
+
+
+class StubGenerator:
+    """Stand-in for AITextGenerator that counts model loads."""
+    
+    def __init__(self, available: bool):
+        self.available = available
+        self.load_calls = 0
+    
+    def is_available(self):
+        return self.available
+    
+    def is_loaded(self):
+        return self.load_calls > 0
+    
+    def load_model(self):
+        self.load_calls += 1
+        return True
+
+
+class TestAutocomplete:
+    """Test autocomplete helpers."""
+    
+    @pytest.fixture
+    def autocomplete(self):
+        """Create autocomplete instance without search backends."""
+        return Autocomplete(local_search=None)
+    
+    def test_extract_query_last_sentence(self, autocomplete):
+        """Test the query is the text after the last sentence boundary."""
+        assert autocomplete._extract_query("First one. Second! Third part") == "Third part"
+        assert autocomplete._extract_query("Line one\nline two") == "line two"
+    
+    def test_extract_query_without_boundary(self, autocomplete):
+        """Test context without a boundary is used as is."""
+        assert autocomplete._extract_query("  no boundary here  ") == "no boundary here"
+        assert autocomplete._extract_query("Ends with a period.") == "Ends with a period."
+    
+    def test_preload_loads_generator_once(self):
+        """Test preload loads an available generator model only if not yet loaded."""
+        generator = StubGenerator(available=True)
+        autocomplete = Autocomplete(local_search=None, ai_generator=generator)
+        
+        assert autocomplete.preload()
+        assert autocomplete.preload()
+        assert generator.load_calls == 1
+    
+    def test_preload_skips_unavailable_generator(self):
+        """Test preload does not try to load a generator without a model."""
+        generator = StubGenerator(available=False)
+        autocomplete = Autocomplete(local_search=None, ai_generator=generator)
+        
+        assert not autocomplete.preload()
+        assert generator.load_calls == 0
+
+
+class TestTextReplacer:
+    """Test text replacer helpers."""
+    
+    @pytest.fixture
+    def replacer(self):
+        """Create text replacer instance without search backends."""
+        return TextReplacer(local_search=None)
+    
+    def test_refinement_uses_first_sentence(self, replacer):
+        """Test refinement takes the first non-empty sentence of the result."""
+        result = {'text': '. Python is readable. It is popular. '}
+        assert replacer._create_refinement("python", result, "") == "Python is readable."
+    
+    def test_expansion_skips_repeated_sentences(self, replacer):
+        """Test expansion appends each result's first sentence once."""
+        results = [{'text': 'Lists are mutable. More text'}, {'text': 'Lists are mutable. Other'}]
+        assert replacer._create_expansion("Python has lists", results) == "Python has lists. Lists are mutable."
+
+
+class StubLlama:
+    """Stand-in for llama_cpp.Llama returning a different completion per call."""
+    
+    def __init__(self):
+        self.prompts = []
+    
+    def __call__(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return {'choices': [{'text': f" completion {len(self.prompts)} "}]}
+
+
+class TestAITextGenerator:
+    """Test AI generator prompt handling with a stub model."""
+    
+    @pytest.fixture
+    def generator(self):
+        """Create generator with a stub model already loaded."""
+        generator = AITextGenerator()
+        generator.llm = StubLlama()
+        generator._is_loaded = True
+        return generator
+    
+    def test_generate_multiple_distinct(self, generator):
+        """Test one call returns N distinct suggestions built from a single prompt."""
+        context = [{'text': 'Python is a programming language.'}]
+        suggestions = generator.generate_multiple("Python is", context=context, count=3)
+        
+        assert suggestions == ['completion 1', 'completion 2', 'completion 3']
+        assert len(set(generator.llm.prompts)) == 1
+        assert 'Python is a programming language.' in generator.llm.prompts[0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -16,20 +16,22 @@ class TextEditor(QTextEdit):
     """
     
     # Signals
-    text_changed_delayed = Signal(str)  # Emitted after debounce
+    text_changed_delayed = Signal(str)  # Emitted after debounce with the context before the cursor
     selection_changed_signal = Signal(str)  # Emitted when selection changes
     
-    def __init__(self, parent=None, debounce_ms: int = 500):
+    def __init__(self, parent=None, debounce_ms: int = 500, context_length: int = 200):
         """
         Initialize the text editor.
         
         Args:
             parent: Parent widget
             debounce_ms: Debounce time for text change events
+            context_length: Characters before the cursor sent with text_changed_delayed
         """
         super().__init__(parent)
         
         self.debounce_ms = debounce_ms
+        self.context_length = context_length
         self._debounce_timer = QTimer()
         self._debounce_timer.setSingleShot(True)
         self._debounce_timer.timeout.connect(self._on_debounce_timeout)
@@ -49,14 +51,12 @@ class TextEditor(QTextEdit):
     
     def _on_text_changed(self):
         """Handle text change events with debouncing."""
-        # Restart debounce timer
-        self._debounce_timer.stop()
+        # Restart debounce timer (start() reschedules an active timer)
         self._debounce_timer.start(self.debounce_ms)
     
     def _on_debounce_timeout(self):
         """Handle debounced text change."""
-        text = self.toPlainText()
-        self.text_changed_delayed.emit(text)
+        self.text_changed_delayed.emit(self.get_context(self.context_length))
     
     def _on_selection_changed(self):
         """Handle selection change events."""
@@ -76,18 +76,14 @@ class TextEditor(QTextEdit):
         Returns:
             Context string
         """
-        cursor = self.textCursor()
-        position = cursor.position()
-        
-        # Get text up to cursor
-        full_text = self.toPlainText()
-        context = full_text[:position]
+        position = self.textCursor().position()
         
-        # Limit to max_length
-        if len(context) > max_length:
-            context = context[-max_length:]
+        # Select only the window before the cursor instead of copying the whole document
+        cursor = QTextCursor(self.document())
+        cursor.setPosition(max(0, position - max_length))
+        cursor.setPosition(position, QTextCursor.KeepAnchor)
         
-        return context
+        return cursor.selection().toPlainText()
     
     def show_suggestion(self, suggestion: str):
         """
@@ -20,6 +20,9 @@ class GenerateButton(QPushButton):
     expand_requested = Signal(str)  # Emitted when expand is requested
     alternatives_requested = Signal(str)  # Emitted when alternatives requested
     
+    # Smaller cursor movements while a selection is dragged do not move the button
+    MOVE_THRESHOLD_PX = 4
+    
     def __init__(self, parent=None):
         """
         Initialize the generate button.
@@ -31,23 +34,8 @@ class GenerateButton(QPushButton):
         
         self._selected_text = ""
         
-        # Configure button appearance
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #0066cc;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0052a3;
-            }
-            QPushButton:pressed {
-                background-color: #003d7a;
-            }
-        """)
+        # Appearance comes from the application style sheet (ui/styles.py)
+        self.setObjectName("generateButton")
         
         # Create context menu
         self._create_menu()
@@ -109,10 +97,16 @@ class GenerateButton(QPushButton):
         if position is None:
             position = QCursor.pos()
         
-        # Position button near selection
-        self.move(position.x(), position.y() - self.height() - 5)
-        self.show()
-        self.raise_()
+        # Position button near selection; selectionChanged fires on every drag step
+        target = QPoint(position.x(), position.y() - self.height() - 5)
+        visible = self.isVisible()
+        
+        if not visible or (target - self.pos()).manhattanLength() >= self.MOVE_THRESHOLD_PX:
+            self.move(target)
+        
+        if not visible:
+            self.show()
+            self.raise_()
         
         logger.debug(f"Generate button shown for: {selected_text[:30]}...")
     
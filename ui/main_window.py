@@ -4,12 +4,14 @@ Primary application window with all UI components.
 """
 
 import sys
+import queue
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QFileDialog, QTextEdit,
+    QPushButton, QLabel, QFileDialog, QPlainTextEdit,
     QProgressBar, QStatusBar, QMenuBar, QMenu,
     QMessageBox, QSplitter
 )
@@ -21,6 +23,7 @@ from ui.editor import TextEditor
 from ui.generate_button import GenerateButton
 from suggestion.autocomplete import Autocomplete
 from suggestion.text_replacer import TextReplacer
+from config.settings import config
 
 
 class DocumentIndexer(QThread):
@@ -57,7 +60,7 @@ class DocumentIndexer(QThread):
                 self.finished.emit(True, "Documents indexed successfully!")
             else:
                 self.finished.emit(False, "Indexing failed. Check logs.")
-                
+        
         except Exception as e:
             logger.error(f"Error in indexing thread: {e}")
             self.finished.emit(False, f"Error: {str(e)}")
@@ -67,12 +70,75 @@ class DocumentIndexer(QThread):
         self.progress.emit(progress, message)
 
 
+class SuggestionWorker(QThread):
+    """Persistent background thread that generates suggestions for queued contexts."""
+    
+    suggestions_ready = Signal(int, list, str, bool)  # request seq, suggestions, context, succeeded
+    
+    def __init__(self, autocomplete: Autocomplete, num_suggestions: int = 5):
+        """
+        Initialize suggestion worker.
+        
+        Args:
+            autocomplete: Autocomplete engine used to generate suggestions
+            num_suggestions: Number of suggestions per request
+        """
+        super().__init__()
+        self.autocomplete = autocomplete
+        self.num_suggestions = num_suggestions
+        self._queue: queue.Queue = queue.Queue(maxsize=1)
+    
+    def submit(self, context: Optional[str], seq: int = 0):
+        """
+        Queue a context for suggestion generation.
+        Replaces any context still waiting, so bursts collapse to the latest.
+        
+        Args:
+            context: Text before the cursor, or None to stop the worker
+            seq: Request sequence number echoed back with the results
+        """
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._queue.put_nowait((seq, context))
+    
+    def stop(self):
+        """Stop the worker and wait for the current request to finish."""
+        self.submit(None)
+        self.wait()
+    
+    def run(self):
+        """Preload models, then generate suggestions until stopped."""
+        self.autocomplete.preload()
+        
+        while True:
+            seq, context = self._queue.get()
+            if context is None:
+                break
+            
+            try:
+                suggestions = self.autocomplete.get_suggestions(
+                    context, num_suggestions=self.num_suggestions
+                )
+                succeeded = True
+            except Exception as e:
+                logger.error(f"Error in suggestion thread: {e}")
+                suggestions = []
+                succeeded = False
+            
+            self.suggestions_ready.emit(seq, suggestions, context, succeeded)
+
+
 class MainWindow(QMainWindow):
     """
     Main application window.
     Contains editor, controls, and manages UI interactions.
     """
     
+    # Number of recent contexts whose suggestions are kept for instant redisplay
+    SUGGESTION_CACHE_SIZE = 256
+    
     def __init__(self, app_controller):
         """
         Initialize main window.
@@ -86,6 +152,14 @@ class MainWindow(QMainWindow):
         self.autocomplete: Optional[Autocomplete] = None
         self.text_replacer: Optional[TextReplacer] = None
         self.indexer_thread: Optional[DocumentIndexer] = None
+        self.suggestion_worker: Optional[SuggestionWorker] = None
+        self._suggestion_cache: "OrderedDict[str, list]" = OrderedDict()
+        
+        # Bumped on every suggestion request; only the latest request's results are shown
+        self._request_seq = 0
+        
+        # Suggestions currently rendered in the panel (None after it shows anything else)
+        self._shown_suggestions: Optional[tuple] = None
         
         self._init_ui()
         self._connect_signals()
@@ -115,7 +189,7 @@ class MainWindow(QMainWindow):
         splitter = QSplitter(Qt.Horizontal)
         
         # Create editor
-        self.editor = TextEditor(debounce_ms=500)
+        self.editor = TextEditor(debounce_ms=config.debounce_ms)
         splitter.addWidget(self.editor)
         
         # Create info panel
@@ -198,15 +272,15 @@ class MainWindow(QMainWindow):
         title = QLabel("<b>Suggestions</b>")
         layout.addWidget(title)
         
-        # Suggestions display
-        self.suggestions_display = QTextEdit()
+        # Suggestions display (plain text only, so skip rich-text layout)
+        self.suggestions_display = QPlainTextEdit()
         self.suggestions_display.setReadOnly(True)
         self.suggestions_display.setPlaceholderText("Suggestions will appear here...")
         layout.addWidget(self.suggestions_display)
         
         # Source info
         self.source_info_label = QLabel("Source: -")
-        self.source_info_label.setStyleSheet("color: #666; font-size: 10px;")
+        self.source_info_label.setObjectName("sourceInfoLabel")
         layout.addWidget(self.source_info_label)
         
         return panel
@@ -276,45 +350,83 @@ class MainWindow(QMainWindow):
         try:
             self.autocomplete = self.app_controller.get_autocomplete()
             self.text_replacer = self.app_controller.get_text_replacer()
+            
+            if self.suggestion_worker is None:
+                self.suggestion_worker = SuggestionWorker(self.autocomplete, num_suggestions=5)
+                self.suggestion_worker.suggestions_ready.connect(self._on_suggestions_ready)
+                self.suggestion_worker.start()
+            else:
+                self.suggestion_worker.autocomplete = self.autocomplete
+            
+            # Suggestions from the previous index are stale, including any still being generated
+            self._request_seq += 1
+            self._suggestion_cache.clear()
+            
             logger.info("Suggestion engines initialized")
         except Exception as e:
             logger.error(f"Error initializing suggestion engines: {e}")
     
-    def _on_text_changed(self, text: str):
+    def _on_text_changed(self, context: str):
         """Handle debounced text changes."""
-        if not self.suggestions_toggle.isChecked() or not self.autocomplete:
+        if not self.suggestions_toggle.isChecked() or not self.suggestion_worker:
             return
         
-        # Get context and generate suggestions
-        context = self.editor.get_context(max_length=200)
-        
         if len(context) > 10:  # Only suggest if meaningful context exists
-            # Request more suggestions for richer content
-            suggestions = self.autocomplete.get_suggestions(context, num_suggestions=5)
-            self._display_suggestions(suggestions, context)
+            self._request_seq += 1
+            
+            cached = self._suggestion_cache.get(context)
+            if cached is not None:
+                self._suggestion_cache.move_to_end(context)
+                self._display_suggestions(cached, context)
+                return
+            
+            # Generate off the UI thread; results arrive via suggestions_ready
+            self.suggestion_worker.submit(context, self._request_seq)
+    
+    def _on_suggestions_ready(self, seq: int, suggestions: list, context: str, succeeded: bool):
+        """Display suggestions generated by the worker if still current, caching successful ones."""
+        # A newer request or a re-index supersedes them; they may come from the old index
+        if seq != self._request_seq:
+            logger.debug(f"Dropping stale suggestions for request {seq}")
+            return
+        
+        # The empty fallback after an error must not hide suggestions on the next attempt
+        if succeeded:
+            self._suggestion_cache[context] = suggestions
+            if len(self._suggestion_cache) > self.SUGGESTION_CACHE_SIZE:
+                self._suggestion_cache.popitem(last=False)
+        
+        self._display_suggestions(suggestions, context)
     
     def _display_suggestions(self, suggestions: list, context: str = ""):
         """Display suggestions in info panel with enhanced formatting."""
+        # Re-rendering identical suggestions would only relayout the panel
+        shown = tuple(suggestions)
+        panel_current = shown == self._shown_suggestions
+        self._shown_suggestions = shown
+        
         if suggestions:
-            display_parts = []
-            for i, sugg in enumerate(suggestions, 1):
-                # Format each suggestion with better visual separation
-                display_parts.append(f"━━━ Suggestion {i} ━━━\n{sugg}")
-            
-            display_text = "\n\n".join(display_parts)
-            self.suggestions_display.setPlainText(display_text)
+            if not panel_current:
+                display_parts = []
+                for i, sugg in enumerate(suggestions, 1):
+                    # Format each suggestion with better visual separation
+                    display_parts.append(f"━━━ Suggestion {i} ━━━\n{sugg}")
+                
+                display_text = "\n\n".join(display_parts)
+                self.suggestions_display.setPlainText(display_text)
             
             # Show count and query hint
             query_hint = context[-30:] if len(context) > 30 else context
             self.source_info_label.setText(f"Found {len(suggestions)} suggestions for: ...{query_hint}")
         else:
-            self.suggestions_display.setPlainText(
-                "No suggestions available.\n\n"
-                "💡 Tips:\n"
-                "• Type at least 10 characters\n"
-                "• Make sure documents are loaded\n"
-                "• Try lowering similarity threshold in config.yaml"
-            )
+            if not panel_current:
+                self.suggestions_display.setPlainText(
+                    "No suggestions available.\n\n"
+                    "💡 Tips:\n"
+                    "• Type at least 10 characters\n"
+                    "• Make sure documents are loaded\n"
+                    "• Try lowering similarity threshold in config.yaml"
+                )
             self.source_info_label.setText("Source: -")
     
     def _on_selection_changed(self, selected_text: str):
@@ -379,6 +491,7 @@ class MainWindow(QMainWindow):
                 f"Alt {i+1}: {alt}" for i, alt in enumerate(alternatives)
             )
             self.suggestions_display.setPlainText(alt_text)
+            self._shown_suggestions = None
             self.source_info_label.setText("Alternatives from local documents")
             self.status_bar.showMessage(f"Found {len(alternatives)} alternatives", 3000)
         else:
@@ -392,9 +505,18 @@ class MainWindow(QMainWindow):
         self.suggestions_toggle.setText(f"💡 Suggestions: {'ON' if is_on else 'OFF'}")
         
         if not is_on:
+            # Results still being generated must not reappear after clearing
+            self._request_seq += 1
             self.suggestions_display.clear()
+            self._shown_suggestions = None
             self.source_info_label.setText("Source: -")
     
+    def closeEvent(self, event):
+        """Stop background threads before closing."""
+        if self.suggestion_worker:
+            self.suggestion_worker.stop()
+        super().closeEvent(event)
+    
     def _show_about(self):
         """Show about dialog."""
         QMessageBox.about(
@@ -0,0 +1,26 @@
+"""
+Application Styles
+Single style sheet applied once to the whole application.
+"""
+
+# Widgets opt in through their object names, so Qt parses the rules only once
+APP_STYLESHEET = """
+QPushButton#generateButton {
+    background-color: #0066cc;
+    color: white;
+    border: none;
+    border-radius: 4px;
+    padding: 6px 12px;
+    font-weight: bold;
+}
+QPushButton#generateButton:hover {
+    background-color: #0052a3;
+}
+QPushButton#generateButton:pressed {
+    background-color: #003d7a;
+}
+QLabel#sourceInfoLabel {
+    color: #666;
+    font-size: 10px;
+}
+"""